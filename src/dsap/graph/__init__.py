@@ -1,6 +1,7 @@
+from .bitset_graph import BitsetGraph
 from .matrix_graph import MatrixGraph
 from .node_graph import NodeGraph
 
 Graph = NodeGraph
 
-__all__ = ["Graph", "MatrixGraph", "NodeGraph"]
+__all__ = ["BitsetGraph", "Graph", "MatrixGraph", "NodeGraph"]
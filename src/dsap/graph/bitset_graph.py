@@ -0,0 +1,337 @@
+from typing import Iterator
+
+from dsap.sort import sort
+from dsap.stack import Stack
+
+from .graph import GraphBase
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Yields the indices of the set bits in a mask, from lowest to highest.
+
+    Args:
+        mask (int): A non-negative bitset.
+
+    Yields:
+        Iterator[int]: Index of each set bit, in increasing order.
+
+    Examples:
+        >>> list(_bits(0b101100))
+        [2, 3, 5]
+        >>> list(_bits(0))
+        []
+    """
+    while mask:
+        lowest = mask & -mask  # Isolate the lowest set bit.
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+class BitsetGraph[T](GraphBase[T]):
+    """Graph data structure implemented using an adjacency list of int bitsets.
+
+    Each node is mapped to a sequential int id. The neighbors of the node with id i are
+    stored as a single int, _adj[i], where bit j is set if there is an edge from i to j.
+    Edge operations become bitwise operations on one (arbitrary-precision) int, and BFS
+    expands a whole frontier at once by OR'ing the neighbor sets together. All of these
+    run in C rather than hashing each neighbor in Python.
+
+    A bitset graph works best for small, dense graphs (e.g., up to a few hundred
+    nodes), where each neighbor set only spans a few machine words.
+
+    Basic operations: (V is number of nodes, E is number of edges)
+      - from_edges, O(V + E)
+      - add, O(1)
+      - remove, O(V), since the ids above the removed node are shifted down
+      - add_edge, O(1)
+      - remove_edge, O(1)
+      - has_edge, O(1)
+      - __iter__, O(V)
+      - bfs_iterator, O(V + E)
+      - dfs_iterator, O(V + E)
+
+    Bitwise operations are O(V / w) for word size w, which is O(1) for small graphs.
+    """
+
+    _nodes: list[T]
+    _id: dict[T, int]
+    _adj: list[int]
+
+    def __init__(self):
+        self._nodes = []
+        self._id = {}
+        self._adj = []
+
+    def add(self, node: T) -> None:
+        """Add a new (empty) node into the graph. Does not create any edges.
+
+        If the node already exists, this does nothing.
+
+        Args:
+            node (T): The node value to add.
+
+        Examples:
+            >>> graph = BitsetGraph()
+            >>> graph.add(1)
+            >>> graph.add(2)
+            >>> len(graph)
+            2
+        """
+        if node in self._id:
+            return
+        self._id[node] = len(self._nodes)
+        self._nodes.append(node)
+        self._adj.append(0)
+
+    def remove(self, node: T) -> None:
+        """Remove a node (and all edges to/from it) from the graph.
+
+        If the node does not exist, this function does nothing. Ids stay sequential, so
+        every node after the removed one moves down by one id, and every neighbor set
+        drops the removed bit (shifting the higher bits down to match).
+
+        Complexity:
+            Time: O(V), to re-map ids and update each neighbor set.
+
+        Args:
+            node (T): The node value to remove.
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (2, 3), (3, 1)])
+            >>> graph.remove(2)
+            >>> print(graph)
+            1 -> []
+            3 -> [1]
+        """
+        node_id = self._id.pop(node, None)
+        if node_id is None:
+            return
+
+        del self._nodes[node_id]
+        del self._adj[node_id]
+        low_mask = (1 << node_id) - 1
+        self._adj = [
+            (mask & low_mask) | ((mask >> (node_id + 1)) << node_id)
+            for mask in self._adj
+        ]
+        for other_id in range(node_id, len(self._nodes)):
+            self._id[self._nodes[other_id]] = other_id
+
+    def add_edge(self, edge: tuple[T, T]) -> None:
+        """Add a (from, to) edge pair to the graph.
+
+        Both from and to nodes will be added if they are not already part of the graph.
+
+        Args:
+            edge (tuple[T, T]): The edge to be added.
+
+        Examples:
+            >>> graph = BitsetGraph()
+            >>> graph.add_edge((1, 2))
+            >>> graph.has_edge((1, 2))
+            True
+            >>> 1 in graph
+            True
+        """
+        self.add(edge[0])
+        self.add(edge[1])
+        self._adj[self._id[edge[0]]] |= 1 << self._id[edge[1]]
+
+    def remove_edge(self, edge: tuple[T, T]) -> None:
+        """Remove an edge from the graph (if it exists).
+
+        If the edge does not exist, the graph will not be affected. Even if a removed
+        edge causes a node to have no remaining neighbors, that node will still remain
+        in the graph (unless it is specifically removed).
+
+        Args:
+            edge (tuple[T, T]): The edge to be removed, given as (from, to) pair.
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (2, 2), (3, 4)])
+            >>> graph.remove_edge((3, 4))
+            >>> graph.has_edge((3, 4))
+            False
+            >>> 4 in graph
+            True
+        """
+        if edge[0] not in self._id or edge[1] not in self._id:
+            return
+
+        self._adj[self._id[edge[0]]] &= ~(1 << self._id[edge[1]])
+
+    def has_edge(self, edge: tuple[T, T]) -> bool:
+        """Whether the graph has a given (from, to) edge between two nodes.
+
+        Args:
+            edge (tuple[T, T]): The edge to check for.
+
+        Returns:
+            bool: True if the connection (from, to) exists in the graph. False,
+              otherwise.
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (3, 4)])
+            >>> graph.has_edge((3, 4))
+            True
+            >>> graph.has_edge((1, 1))
+            False
+        """
+        if edge[0] not in self._id or edge[1] not in self._id:
+            return False
+
+        return bool((self._adj[self._id[edge[0]]] >> self._id[edge[1]]) & 1)
+
+    def __iter__(self) -> Iterator[T]:
+        """Returns an iterator over node values in the graph.
+
+        Complexity:
+            Time: O(V), since we have access to each node value without a BFS/DFS
+              traversal over the graph.
+
+        Returns:
+            Iterator[T]: Nodes in the graph.
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (3, 4)])
+            >>> list(graph)
+            [1, 2, 3, 4]
+        """
+        return iter(self._nodes)
+
+    def bfs_iterator(self, start: T) -> Iterator[T]:
+        """Breadth-first search iterator over nodes in the graph from a given start.
+
+        Rather than a queue, the search keeps the current BFS level as a bitset. The
+        next level is the union (OR) of the neighbor sets of the current level, minus
+        any nodes already seen. Nodes within one level are visited in id order.
+
+        Unconnected components will not be visited, because the search will start from
+        the given node, which may not connect to all nodes in the graph. Cycles are
+        handled.
+
+        Complexity:
+            Time: O(V + E), due to having to travel (at worst case) all nodes and edges.
+
+        Args:
+            start (T): The node to start the BFS traversal from.
+
+        Yields:
+            Iterator[T]: Nodes visited in BFS order (starting with the given node).
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (2, 3), (3, 3)])
+            >>> list(graph.bfs_iterator(1))
+            [1, 2, 3]
+            >>> list(graph.bfs_iterator(3))
+            [3]
+        """
+        if start not in self._id:
+            return
+
+        frontier = seen = 1 << self._id[start]
+        while frontier:
+            next_frontier = 0
+            for node in _bits(frontier):
+                yield self._nodes[node]
+                next_frontier |= self._adj[node]
+            frontier = next_frontier & ~seen
+            seen |= frontier
+
+    def dfs_iterator(self, start: T) -> Iterator[T]:
+        """Depth-first search iterator over nodes in the graph from a given start.
+
+        Using a stack, we can traverse the graph from some starting point in DFS manner.
+        For each node, we will traverse edges as deeply as possible before visiting
+        other neighbors in the graph. The seen nodes are tracked as a bitset, so only
+        unseen neighbors are pushed onto the stack.
+
+        Unconnected components will not be visited, because the search will start from
+        the given node, which may not connect to all nodes in the graph. Cycles are
+        handled.
+
+        Complexity:
+            Time: O(V + E), due to having to travel (at worst case) all nodes and edges.
+
+        Args:
+            start (T): The node to start the DFS traversal from.
+
+        Yields:
+            Iterator[T]: Nodes visited in DFS order (starting with the given node).
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (2, 3), (3, 3)])
+            >>> list(graph.dfs_iterator(1))
+            [1, 2, 3]
+            >>> list(graph.dfs_iterator(3))
+            [3]
+        """
+        if start not in self._id:
+            return
+
+        seen = 0
+        stack = Stack[int].from_iterable([self._id[start]])
+        while stack:
+            node = stack.pop()
+            if node is None or (seen >> node) & 1:
+                continue
+            seen |= 1 << node
+
+            yield self._nodes[node]
+            for neighbor in _bits(self._adj[node] & ~seen):
+                stack.push(neighbor)
+
+    def __contains__(self, value: T) -> bool:
+        """Return if a given value exists in the graph.
+
+        This checks for node containment only: the linking of edges is irrelevant to
+        whether or not a node is in the graph (except that a node always exists if an
+        edge from/to it exists).
+
+        Args:
+            value (T): The value to search for in the graph.
+
+        Returns:
+            bool: True if the node value is in the graph. False, otherwise.
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (2, 2), (3, 4)])
+            >>> 3 in graph
+            True
+            >>> 5 in graph
+            False
+        """
+        return value in self._id
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the graph.
+
+        Returns:
+            int: The number of nodes in the graph.
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (2, 2), (3, 4)])
+            >>> len(graph)
+            4
+        """
+        return len(self._nodes)
+
+    def __str__(self) -> str:
+        """Returns a printable display of the adjacency list graph structure.
+
+        Returns:
+            str: The printable representation of the graph.
+
+        Examples:
+            >>> graph = BitsetGraph().from_edges([(1, 2), (2, 3), (4, 4)])
+            >>> print(graph)
+            1 -> [2]
+            2 -> [3]
+            3 -> []
+            4 -> [4]
+        """
+        out: list[str] = []
+        for node, mask in zip(self._nodes, self._adj):
+            neighbors = [self._nodes[i] for i in _bits(mask)]
+            out.append(f"{node} -> {neighbors}")
+        return "\n".join(sort(out))
@@ -53,6 +53,10 @@ class GraphBase[T](ABC):
         whether or not a node is in the graph (except that a node always exists if an
         edge from/to it exists).
 
+        Complexity:
+            Time: O(V), since this default scans every node. Subclasses with a node
+              lookup table should override this with an O(1) check.
+
         Args:
             value (T): The value to search for in the graph.
 
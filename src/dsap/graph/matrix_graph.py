@@ -194,13 +194,13 @@ class MatrixGraph[T](GraphBase[T]):
         return self._matrix[self._node_to_id[edge[0]]][self._node_to_id[edge[1]]]
 
     def __iter__(self) -> Iterator[T]:
-        """Yields an iterator over node values in the graph.
+        """Returns an iterator over node values in the graph.
 
         Complexity:
             Time: O(V), since we have access to each node value without a BFS/DFS
               traversal over the graph.
 
-        Yields:
+        Returns:
             Iterator[T]: Nodes in the graph.
 
         Examples:
@@ -208,7 +208,7 @@ class MatrixGraph[T](GraphBase[T]):
             >>> list(graph)
             [1, 2, 3, 4]
         """
-        yield from self._nodes
+        return iter(self._nodes)
 
     def bfs_iterator(self, start: T) -> Iterator[T]:
         """Breadth-first search iterator over nodes in the graph from a given start.
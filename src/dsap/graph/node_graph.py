@@ -1,6 +1,6 @@
 from typing import Iterator
 
-from dsap.hash import Map, Set
+from dsap.hash import Set
 from dsap.queue import Queue
 from dsap.sort import sort
 from dsap.stack import Stack
@@ -9,16 +9,22 @@ from .graph import GraphBase
 
 
 class NodeGraph[T](GraphBase[T]):
-    """Graph data structure implemented using an adjacency list of {node: Set[node]}.
+    """Graph data structure implemented using an adjacency list of {node: {node: None}}.
 
     We directly hash the value T as a node, and do not add any extra class / object
     overhead. Therefore, the value T type must be hashable. We aggregate edges into a
-    set for faster lookup. Other design options are list[node] (unsorted / sorted) and
-    LinkedList[node].
+    dict (with None values) used as an insertion-ordered set. This gives O(1) lookup
+    like a set, but neighbors are iterated in the order their edges were added, by
+    walking the dict's compact entry array. Other design options are list[node]
+    (unsorted / sorted) and LinkedList[node].
+
+    We also keep the reverse adjacency list (inbound edges for each node). This doubles
+    the memory used per edge, but removing a node only needs to visit its own edges,
+    rather than every other node in the graph.
 
     Basic operations: (V is number of nodes, E is number of edges)
       - add, O(1)
-      - remove, O(V)
+      - remove, O(d), where d is the number of edges to/from the node
       - add_edge, O(1)
       - remove_edge, O(1)
       - has_edge, O(1)
@@ -27,10 +33,12 @@ class NodeGraph[T](GraphBase[T]):
       - dfs_iterator, O(V + E)
     """
 
-    _nodes: Map[T, Set[T]]
+    _nodes: dict[T, dict[T, None]]  # Outbound edges: {from: {to: None}}.
+    _inbound: dict[T, dict[T, None]]  # Inbound edges: {to: {from: None}}.
 
     def __init__(self):
-        self._nodes = Map()
+        self._nodes = {}
+        self._inbound = {}
 
     def add(self, node: T) -> None:
         """Add a new (empty) node into the graph. Does not create any edges.
@@ -48,7 +56,8 @@ class NodeGraph[T](GraphBase[T]):
             2
         """
         if node not in self._nodes:
-            self._nodes[node] = Set()
+            self._nodes[node] = {}
+            self._inbound[node] = {}
 
     def remove(self, node: T) -> None:
         """Remove a node (and all edges to/from it) from the graph.
@@ -58,8 +67,9 @@ class NodeGraph[T](GraphBase[T]):
         will reference a missing node!).
 
         Complexity:
-            Time: O(V), due to having to remove inbound edges to the removed node.
-              Requires checking all the other nodes in O(1) time each (due to set).
+            Time: O(d), where d is the number of edges to/from the node. The reverse
+              adjacency list gives us the inbound edges directly, so we do not need to
+              check every other node in the graph.
 
         Args:
             node (T): The node value to remove.
@@ -74,9 +84,12 @@ class NodeGraph[T](GraphBase[T]):
         """
         if node not in self._nodes:
             return
-        for other in self:
-            self.remove_edge((other, node))
-        del self._nodes[node]
+        # Any self-loop is removed by the first loop, so the second loop never sees
+        # the (already popped) node as a destination.
+        for source in self._inbound.pop(node):
+            del self._nodes[source][node]
+        for destination in self._nodes.pop(node):
+            del self._inbound[destination][node]
 
     def add_edge(self, edge: tuple[T, T]) -> None:
         """Add a (from, to) edge pair to the graph.
@@ -96,7 +109,8 @@ class NodeGraph[T](GraphBase[T]):
         """
         self.add(edge[0])
         self.add(edge[1])
-        self._nodes[edge[0]].add(edge[1])
+        self._nodes[edge[0]][edge[1]] = None
+        self._inbound[edge[1]][edge[0]] = None
 
     def remove_edge(self, edge: tuple[T, T]) -> None:
         """Remove an edge from the graph (if it exists).
@@ -117,7 +131,8 @@ class NodeGraph[T](GraphBase[T]):
             True
         """
         try:
-            self._nodes[edge[0]].remove(edge[1])
+            del self._nodes[edge[0]][edge[1]]
+            del self._inbound[edge[1]][edge[0]]
         except KeyError:
             pass  # Edge not found, this is OK.
 
@@ -141,13 +156,16 @@ class NodeGraph[T](GraphBase[T]):
         return edge[0] in self._nodes and edge[1] in self._nodes[edge[0]]
 
     def __iter__(self) -> Iterator[T]:
-        """Yields an iterator over node values in the graph.
+        """Returns an iterator over node values in the graph.
+
+        We return the dict's own key iterator, rather than wrapping it in a generator,
+        so no Python frame is resumed per node.
 
         Complexity:
             Time: O(V), since we have access to each node value without a BFS/DFS
               traversal over the graph.
 
-        Yields:
+        Returns:
             Iterator[T]: Nodes in the graph.
 
         Examples:
@@ -155,7 +173,7 @@ class NodeGraph[T](GraphBase[T]):
             >>> list(graph)
             [1, 2, 3, 4]
         """
-        yield from self._nodes.keys()
+        return iter(self._nodes)
 
     def bfs_iterator(self, start: T) -> Iterator[T]:
         """Breadth-first search iterator over nodes in the graph from a given start.
@@ -241,6 +259,31 @@ class NodeGraph[T](GraphBase[T]):
             for neighbor in self._nodes[node]:
                 stack.push(neighbor)
 
+    def __contains__(self, value: T) -> bool:
+        """Return if a given value exists in the graph.
+
+        This checks for node containment only: the linking of edges is irrelevant to
+        whether or not a node is in the graph (except that a node always exists if an
+        edge from/to it exists).
+
+        Complexity:
+            Time: O(1), a lookup in the adjacency dict (rather than scanning the nodes).
+
+        Args:
+            value (T): The value to search for in the graph.
+
+        Returns:
+            bool: True if the node value is in the graph. False, otherwise.
+
+        Examples:
+            >>> graph = NodeGraph().from_edges([(1, 2), (2, 2), (3, 4)])
+            >>> 3 in graph
+            True
+            >>> 5 in graph
+            False
+        """
+        return value in self._nodes
+
     def __len__(self) -> int:
         """Returns the number of nodes in the graph.
 
@@ -257,8 +300,8 @@ class NodeGraph[T](GraphBase[T]):
     def __str__(self) -> str:
         """Returns a printable display of the adjacency list graph structure.
 
-        Since the graph is internally implemented with a dict of sets, do not rely on
-        the ordering of the str output! The ordering of neighbors is non-deterministic.
+        Nodes are sorted in the output, and the neighbors of each node are listed in
+        the order that their edges were added.
 
         Returns:
             str: The printable representation of the graph.
@@ -270,6 +313,10 @@ class NodeGraph[T](GraphBase[T]):
             2 -> [3]
             3 -> []
             4 -> [4]
+            >>> print(NodeGraph().from_edges([(1, 3), (1, 2)]))
+            1 -> [3, 2]
+            2 -> []
+            3 -> []
         """
         out: list[str] = []
         for node in iter(self):
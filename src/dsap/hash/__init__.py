@@ -1,7 +1,8 @@
 from .map_linked_list import MapLinkedList
 from .map_list import MapList
+from .map_open_addressing import MapOpenAddressing
 from .set import Set
 
-Map = MapLinkedList
+Map = MapOpenAddressing
 
-__all__ = ["Map", "MapLinkedList", "MapList", "Set"]
+__all__ = ["Map", "MapLinkedList", "MapList", "MapOpenAddressing", "Set"]
@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
+from operator import length_hint
 from typing import Iterable, Iterator, Self
 
+LOAD_FACTOR = 0.75  # Ratio of size:capacity before a hash table grows its capacity.
+
 
 class MapBase[K, V](ABC):
     """Abstract HashMap data structure."""
 
     _size: int
-    _load_factor = 0.75  # Ratio of size:capacity before we grow the map's capacity.
+    _load_factor = LOAD_FACTOR
 
     @abstractmethod
     def __init__(self, /, capacity: int = 31): ...
@@ -15,6 +18,10 @@ class MapBase[K, V](ABC):
     def from_items(cls, items: Iterable[tuple[K, V]]) -> Self:
         """Create (and return) a new hash map from an iterable of (key, value) pairs.
 
+        If the number of items is known in advance (e.g., items is a list), the map is
+        created with enough capacity to hold them all, so it never grows (and rehashes)
+        while the items are inserted.
+
         Args:
             items (Iterable[tuple[K, V]]): An iterable of (key, value) pairs to add into
               the newly created map.
@@ -22,7 +29,7 @@ class MapBase[K, V](ABC):
         Returns:
             Self: The newly created object.
         """
-        hm = cls()
+        hm = cls(capacity=capacity_for(length_hint(items)))
         for key, value in items:
             hm[key] = value
         return hm
@@ -74,13 +81,12 @@ class MapBase[K, V](ABC):
     @abstractmethod
     def _grow(self) -> None: ...
 
-    def _hash(self, key: K) -> int:
-        """The bucket index of the keyed item, based on its hash."""
-        return hash(key) % self._capacity()
-
     def __contains__(self, key: K) -> bool:
         """Return if a given key exists in the map.
 
+        This default relies on __getitem__ raising KeyError, which is costly when the
+        key is missing. Implementations should override it with a non-raising search.
+
         Args:
             key (K): The key to search for in the map.
 
@@ -108,3 +114,28 @@ class MapBase[K, V](ABC):
             bool: True if the map has at least one entry. False, otherwise.
         """
         return len(self) > 0
+
+
+def capacity_for(size: int) -> int:
+    """The initial capacity needed to hold size entries without growing.
+
+    We follow the same sequence of capacities as growing a map from the default (31,
+    63, 127, ...), so a presized map looks the same as one grown naturally. Shared by
+    the maps and Set to presize their tables.
+
+    Args:
+        size (int): The number of entries to hold.
+
+    Returns:
+        int: The smallest capacity in the sequence that can hold size entries.
+
+    Examples:
+        >>> capacity_for(0)
+        31
+        >>> capacity_for(100)
+        255
+    """
+    capacity = 31
+    while size >= LOAD_FACTOR * capacity:
+        capacity = capacity * 2 + 1
+    return capacity
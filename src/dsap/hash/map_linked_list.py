@@ -1,5 +1,4 @@
-from operator import itemgetter
-from typing import Iterator
+from typing import Iterator, Optional
 
 from dsap.linked_list import LinkedList
 
@@ -19,10 +18,14 @@ class MapLinkedList[K, V](MapBase[K, V]):
      - __getitem__, in ~O(1), but really O(k) where k is the length of collided values.
      - pop, in ~O(1), but really O(k) where k is the length of collided values.
      - __iter__ (and variants), in ~O(n).
+
+    Each bucket is only allocated on the first insert into it (an unused bucket is
+    None). Creating or growing the map then allocates a single list of pointers,
+    instead of one linked list per bucket (most of which would stay empty).
     """
 
     # We handle hash collisions simply by extending the list at the colliding key.
-    _buckets: list[LinkedList[tuple[K, V]]]
+    _buckets: list[Optional[LinkedList[tuple[K, V]]]]
 
     def __init__(self, /, capacity: int = 31):
         """Create a new (empty) map.
@@ -31,7 +34,7 @@ class MapLinkedList[K, V](MapBase[K, V]):
             capacity (int, optional): Give a custom capacity to initialize the map. This
               value should be prime to maximize performance. Defaults to 31.
         """
-        self._buckets = [LinkedList() for _ in range(capacity)]
+        self._buckets = [None] * capacity
         self._size = 0
 
     def __getitem__(self, key: K) -> V:
@@ -71,8 +74,12 @@ class MapLinkedList[K, V](MapBase[K, V]):
             >>> hm['d']
             5
         """
-        bucket = self._buckets[self._hash(key)]
-        item = bucket.search(key, key=itemgetter(0))
+        buckets = self._buckets
+        slot = hash(key) % len(buckets)
+        bucket = buckets[slot]
+        if bucket is None:
+            bucket = buckets[slot] = LinkedList()
+        item = self._find(bucket, key)
 
         # Remove then re-insert node, since LinkedList implementation does not expose
         # any pointers to nodes. Therefore, we cannot mutate any node reference here.
@@ -81,7 +88,7 @@ class MapLinkedList[K, V](MapBase[K, V]):
             self._size -= 1
         bucket.push_tail((key, value))
         self._size += 1
-        if self._size >= MapBase._load_factor * self._capacity():
+        if self._size >= MapBase._load_factor * len(buckets):
             self._grow()
 
     def __delitem__(self, key: K) -> None:
@@ -114,7 +121,7 @@ class MapLinkedList[K, V](MapBase[K, V]):
             >>> list(sorted(hm.keys()))
             ['a', 'b', 'c']
         """
-        for bucket in self._buckets:
+        for bucket in filter(None, self._buckets):
             for key, _ in bucket:
                 yield key
 
@@ -129,7 +136,7 @@ class MapLinkedList[K, V](MapBase[K, V]):
             >>> list(sorted(hm.values()))
             [1, 2, 3]
         """
-        for bucket in self._buckets:
+        for bucket in filter(None, self._buckets):
             for _, value in bucket:
                 yield value
 
@@ -144,10 +151,34 @@ class MapLinkedList[K, V](MapBase[K, V]):
             >>> list(sorted(hm.items()))
             [('a', 1), ('b', 2), ('c', 3)]
         """
-        for bucket in self._buckets:
+        for bucket in filter(None, self._buckets):
             for item in bucket:
                 yield item
 
+    def __contains__(self, key: K) -> bool:
+        """Return if a given key exists in the map.
+
+        Searches the key's bucket directly, rather than using the MapBase default
+        (which looks up self[key] and catches KeyError), so a missing key does not
+        raise and catch an exception.
+
+        Args:
+            key (K): The key to search for in the map.
+
+        Returns:
+            bool: True if the key is in the map. False, otherwise.
+
+        Examples:
+            >>> hm = MapLinkedList.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> 'a' in hm
+            True
+            >>> 'd' in hm
+            False
+        """
+        buckets = self._buckets
+        bucket = buckets[hash(key) % len(buckets)]
+        return bucket is not None and self._find(bucket, key) is not None
+
     def _capacity(self) -> int:
         """The total capacity of the hash map (i.e., the number of hashable buckets)."""
         return len(self._buckets)
@@ -172,12 +203,35 @@ class MapLinkedList[K, V](MapBase[K, V]):
             tuple[list[tuple[K, V]], int]: (bucket, index) tuple representing the found
               entry. The entry is at bucket[index].
         """
-        bucket = self._buckets[self._hash(key)]
-        item = bucket.search(key, key=itemgetter(0))
+        buckets = self._buckets
+        bucket = buckets[hash(key) % len(buckets)]
+        if bucket is None:
+            raise KeyError("key not found in map")
+        item = self._find(bucket, key)
         if item is None:
             raise KeyError("key not found in map")
         return bucket, item
 
+    @staticmethod
+    def _find(bucket: LinkedList[tuple[K, V]], key: K) -> Optional[tuple[K, V]]:
+        """Find the entry with the given key in a bucket.
+
+        Like the builtin dict, we check identity before equality, so the same (e.g.,
+        interned) key object matches with a single pointer comparison.
+
+        Args:
+            bucket (LinkedList[tuple[K, V]]): The bucket to search.
+            key (K): The key to search for.
+
+        Returns:
+            Optional[tuple[K, V]]: The (key, value) entry, or None if not found.
+        """
+        for node in bucket.node_iterator():
+            entry_key = node.data[0]
+            if entry_key is key or entry_key == key:
+                return node.data
+        return None
+
     def _grow(self) -> None:
         """Grow the capacity of the map to be roughly double. All items are rehashed.
 
@@ -188,13 +242,22 @@ class MapLinkedList[K, V](MapBase[K, V]):
         the prime 31, so we will always be one less than a power of 2. This gives us a
         chance to use mersenne primes (but at least odd values).
 
+        Entries are moved directly from the old buckets into the new ones. We know every
+        key is unique, so there is no need to search the new bucket (or re-check the
+        load factor) via __setitem__.
+
         Complexity:
-            Time: O(n) to get, then rehash all items into the bigger bucket.
-            Space: O(n) due to storing a copy of items before rehashing.
+            Time: O(n) to rehash all entries into the bigger buckets.
+            Space: O(n) due to holding the old buckets while moving entries.
         """
-        items = list(self.items())
-        self._buckets = [LinkedList() for _ in range(self._capacity() * 2 + 1)]
-        self._size = 0
-
-        for key, value in items:
-            self[key] = value
+        old_buckets = self._buckets
+        capacity = len(old_buckets) * 2 + 1
+        buckets: list[Optional[LinkedList[tuple[K, V]]]] = [None] * capacity
+
+        for bucket in filter(None, old_buckets):
+            for entry in bucket:
+                slot = hash(entry[0]) % capacity
+                if (new_bucket := buckets[slot]) is None:
+                    new_bucket = buckets[slot] = LinkedList()
+                new_bucket.push_tail(entry)
+        self._buckets = buckets
@@ -1,7 +1,4 @@
-from operator import itemgetter
-from typing import Iterator
-
-from dsap.search import linear_search
+from typing import Iterator, Optional
 
 from .map import MapBase
 
@@ -13,16 +10,25 @@ class MapList[K, V](MapBase[K, V]):
     change the internal data structure from list to linked list or binary search tree
     for potential efficiency improvements.
 
+    Each entry also stores the full hash of its key. When scanning a bucket, we compare
+    the (cheap) int hashes first, and only compare keys (which may call a costly
+    __eq__) when the hashes match.
+
     Basic operations:
      - __setitem__, in ~O(1), but really O(k) where k is the length of collided values.
          Worst case, this is O(n) due to rehashing, but this is amortized.
      - __getitem__, in ~O(1), but really O(k) where k is the length of collided values.
      - pop, in ~O(1), but really O(k) where k is the length of collided values.
      - __iter__ (and variants), in ~O(n).
+
+    Each bucket is only allocated on the first insert into it (an unused bucket is
+    None). Creating or growing the map then allocates a single list of pointers,
+    instead of one list object per bucket (most of which would stay empty).
     """
 
-    # We handle hash collisions simply by extending the list at the colliding key.
-    _buckets: list[list[tuple[K, V]]]
+    # We handle hash collisions simply by extending the list at the colliding key. Each
+    # entry is a (hash, key, value) triple.
+    _buckets: list[Optional[list[tuple[int, K, V]]]]
 
     def __init__(self, /, capacity: int = 31):
         """Create a new (empty) map.
@@ -31,7 +37,7 @@ class MapList[K, V](MapBase[K, V]):
             capacity (int, optional): Give a custom capacity to initialize the map. This
               value should be prime to maximize performance. Defaults to 31.
         """
-        self._buckets = [[] for _ in range(capacity)]
+        self._buckets = [None] * capacity
         self._size = 0
 
     def __getitem__(self, key: K) -> V:
@@ -51,7 +57,7 @@ class MapList[K, V](MapBase[K, V]):
             2
         """
         bucket, index = self._get(key)
-        return bucket[index][1]
+        return bucket[index][2]
 
     def __setitem__(self, key: K, value: V) -> None:
         """Sets self[key] to value.
@@ -71,16 +77,21 @@ class MapList[K, V](MapBase[K, V]):
             >>> hm['d']
             5
         """
-        bucket = self._buckets[self._hash(key)]
-        index = linear_search(bucket, key, key=itemgetter(0))
+        buckets = self._buckets
+        hashed = hash(key)
+        slot = hashed % len(buckets)
+        bucket = buckets[slot]
+        if bucket is None:
+            bucket = buckets[slot] = []
+        index = self._find(bucket, hashed, key)
 
         if index is None:
-            bucket.append((key, value))
+            bucket.append((hashed, key, value))
             self._size += 1
-            if self._size >= MapBase._load_factor * self._capacity():
+            if self._size >= MapBase._load_factor * len(buckets):
                 self._grow()
         else:
-            bucket[index] = (key, value)
+            bucket[index] = (hashed, key, value)
 
     def __delitem__(self, key: K) -> None:
         """Delete the entry at self[key].
@@ -112,8 +123,8 @@ class MapList[K, V](MapBase[K, V]):
             >>> list(sorted(hm.keys()))
             ['a', 'b', 'c']
         """
-        for bucket in self._buckets:
-            for key, _ in bucket:
+        for bucket in filter(None, self._buckets):
+            for _, key, _ in bucket:
                 yield key
 
     def values(self) -> Iterator[V]:
@@ -127,8 +138,8 @@ class MapList[K, V](MapBase[K, V]):
             >>> list(sorted(hm.values()))
             [1, 2, 3]
         """
-        for bucket in self._buckets:
-            for _, value in bucket:
+        for bucket in filter(None, self._buckets):
+            for _, _, value in bucket:
                 yield value
 
     def items(self) -> Iterator[tuple[K, V]]:
@@ -142,15 +153,40 @@ class MapList[K, V](MapBase[K, V]):
             >>> list(sorted(hm.items()))
             [('a', 1), ('b', 2), ('c', 3)]
         """
-        for bucket in self._buckets:
-            for item in bucket:
-                yield item
+        for bucket in filter(None, self._buckets):
+            for _, key, value in bucket:
+                yield key, value
+
+    def __contains__(self, key: K) -> bool:
+        """Return if a given key exists in the map.
+
+        Searches the key's bucket directly, rather than using the MapBase default
+        (which looks up self[key] and catches KeyError), so a missing key does not
+        raise and catch an exception.
+
+        Args:
+            key (K): The key to search for in the map.
+
+        Returns:
+            bool: True if the key is in the map. False, otherwise.
+
+        Examples:
+            >>> hm = MapList.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> 'a' in hm
+            True
+            >>> 'd' in hm
+            False
+        """
+        buckets = self._buckets
+        hashed = hash(key)
+        bucket = buckets[hashed % len(buckets)]
+        return bucket is not None and self._find(bucket, hashed, key) is not None
 
     def _capacity(self) -> int:
         """The total capacity of the hash map (i.e., the number of hashable buckets)."""
         return len(self._buckets)
 
-    def _get(self, key: K) -> tuple[list[tuple[K, V]], int]:
+    def _get(self, key: K) -> tuple[list[tuple[int, K, V]], int]:
         """Get the (bucket, index) of the item at the given key.
 
         To get the item, we must find the correct bucket via hashed key. Then, we need
@@ -163,15 +199,40 @@ class MapList[K, V](MapBase[K, V]):
             KeyError: If the key is not found in the map.
 
         Returns:
-            tuple[list[tuple[K, V]], int]: (bucket, index) tuple representing the found
-              entry. The entry is at bucket[index].
+            tuple[list[tuple[int, K, V]], int]: (bucket, index) tuple representing the
+              found entry. The entry is at bucket[index].
         """
-        bucket = self._buckets[self._hash(key)]
-        index = linear_search(bucket, key, key=itemgetter(0))
+        buckets = self._buckets
+        hashed = hash(key)
+        bucket = buckets[hashed % len(buckets)]
+        if bucket is None:
+            raise KeyError("key not found in map")
+        index = self._find(bucket, hashed, key)
         if index is None:
             raise KeyError("key not found in map")
         return bucket, index
 
+    @staticmethod
+    def _find(bucket: list[tuple[int, K, V]], hashed: int, key: K) -> Optional[int]:
+        """Find the index of the entry with the given key in a bucket.
+
+        The stored hash is compared first, so keys are only compared on a hash match.
+        Like the builtin dict, we check identity before equality, so the same (e.g.,
+        interned) key object matches with a single pointer comparison.
+
+        Args:
+            bucket (list[tuple[int, K, V]]): The bucket to search.
+            hashed (int): The hash of the key.
+            key (K): The key to search for.
+
+        Returns:
+            Optional[int]: The index of the entry in the bucket, or None if not found.
+        """
+        for i, (entry_hash, entry_key, _) in enumerate(bucket):
+            if entry_hash == hashed and (entry_key is key or entry_key == key):
+                return i
+        return None
+
     def _grow(self) -> None:
         """Grow the capacity of the map to be roughly double. All items are rehashed.
 
@@ -182,13 +243,23 @@ class MapList[K, V](MapBase[K, V]):
         the prime 31, so we will always be one less than a power of 2. This gives us a
         chance to use mersenne primes (but at least odd values).
 
+        Entries are moved directly from the old buckets into the new ones, using their
+        stored hashes. We know every key is unique, so there is no need to search the
+        new bucket (or re-check the load factor) via __setitem__.
+
         Complexity:
-            Time: O(n) to get, then rehash all items into the bigger bucket.
-            Space: O(n) due to storing a copy of items before rehashing.
+            Time: O(n) to move all entries into the bigger buckets.
+            Space: O(n) due to holding the old buckets while moving entries.
         """
-        items = list(self.items())
-        self._buckets = [[] for _ in range(self._capacity() * 2 + 1)]
-        self._size = 0
-
-        for key, value in items:
-            self[key] = value
+        old_buckets = self._buckets
+        capacity = len(old_buckets) * 2 + 1
+        buckets: list[Optional[list[tuple[int, K, V]]]] = [None] * capacity
+
+        for bucket in filter(None, old_buckets):
+            for entry in bucket:
+                slot = entry[0] % capacity
+                if (new_bucket := buckets[slot]) is None:
+                    buckets[slot] = [entry]
+                else:
+                    new_bucket.append(entry)
+        self._buckets = buckets
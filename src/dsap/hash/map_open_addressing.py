@@ -0,0 +1,163 @@
+from typing import Iterator, Optional, cast
+
+from .map import MapBase
+from .open_addressing import OpenAddressingTable
+
+
+class MapOpenAddressing[K, V](OpenAddressingTable[K, V], MapBase[K, V]):
+    """HashMap data structure implemented using open addressing with Robin Hood probing.
+
+    Every entry lives directly in the table: the hashes, keys, and values are stored in
+    three parallel lists (one slot per index), so there are no per-bucket objects or
+    (key, value) tuples to chase. Collisions are resolved by linear probing, with Robin
+    Hood hashing to keep probe sequences short, and backward-shift deletion (no
+    tombstones). See OpenAddressingTable for details.
+
+    Basic operations:
+     - __setitem__, in ~O(1), but really O(k) where k is the probe length. Worst case,
+         this is O(n) due to rehashing, but this is amortized.
+     - __getitem__, in ~O(1), but really O(k) where k is the probe length.
+     - pop, in ~O(1), but really O(k) where k is the probe length (plus the entries
+         shifted back after the deleted slot).
+     - __iter__ (and variants), in ~O(n).
+    """
+
+    _values: list[Optional[V]]  # A map always has a values list.
+
+    def __init__(self, /, capacity: int = 31):
+        """Create a new (empty) map.
+
+        Args:
+            capacity (int, optional): Give a custom capacity to initialize the map. This
+              value should be prime to maximize performance. Defaults to 31.
+        """
+        self._allocate(capacity, with_values=True)
+        self._size = 0
+
+    def __getitem__(self, key: K) -> V:
+        """Return the value at self[key] without modifying the map.
+
+        Args:
+            key (K): The key of the desired item to get.
+
+        Raises:
+            KeyError: If the key is not found in the map.
+
+        Examples:
+            >>> hm = MapOpenAddressing.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> hm['a']
+            1
+            >>> hm['b']
+            2
+        """
+        index = self._find(key)
+        if index is None:
+            raise KeyError("key not found in map")
+        return cast(V, self._values[index])
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Sets self[key] to value.
+
+        Adds a new (key, value) entry if the key does not exist. If the key does exist,
+        the value will be updated (and the old value discarded).
+
+        Args:
+            key (K): The key to add/set.
+
+        Examples:
+            >>> hm = MapOpenAddressing.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> hm['a'] = 4
+            >>> hm['a']
+            4
+            >>> hm['d'] = 5
+            >>> hm['d']
+            5
+        """
+        self._insert(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        """Delete the entry at self[key].
+
+        Args:
+            key (K): The key to find and delete.
+
+        Raises:
+            KeyError: If the key is not found in the map.
+
+        Examples:
+            >>> hm = MapOpenAddressing.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> del hm['a']
+            >>> 'a' in hm
+            False
+        """
+        index = self._find(key)
+        if index is None:
+            raise KeyError("key not found in map")
+        self._delete_at(index)
+
+    def keys(self) -> Iterator[K]:
+        """Yields keys stored in the map (in an arbitrary order).
+
+        Yields:
+            Iterator[K]: Keys in the map.
+
+        Examples:
+            >>> hm = MapOpenAddressing.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> list(sorted(hm.keys()))
+            ['a', 'b', 'c']
+        """
+        for slot_hash, key in zip(self._hashes, self._keys):
+            if slot_hash is not None:
+                yield cast(K, key)
+
+    def values(self) -> Iterator[V]:
+        """Yields values stored in the map (in an arbitrary order).
+
+        Yields:
+            Iterator[V]: Values in the map.
+
+        Examples:
+            >>> hm = MapOpenAddressing.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> list(sorted(hm.values()))
+            [1, 2, 3]
+        """
+        for slot_hash, value in zip(self._hashes, self._values):
+            if slot_hash is not None:
+                yield cast(V, value)
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        """Yields (key, value) items stored in the map (in an arbitrary order).
+
+        Yields:
+            Iterator[tuple[K, V]]: Entries as (key, value) pairs.
+
+        Examples:
+            >>> hm = MapOpenAddressing.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> list(sorted(hm.items()))
+            [('a', 1), ('b', 2), ('c', 3)]
+        """
+        for slot_hash, key, value in zip(self._hashes, self._keys, self._values):
+            if slot_hash is not None:
+                yield cast(K, key), cast(V, value)
+
+    def __contains__(self, key: K) -> bool:
+        """Return if a given key exists in the map.
+
+        Probes for the key directly, rather than using the MapBase default (which looks
+        up self[key] and catches KeyError), so a missing key does not raise and catch
+        an exception.
+
+        Args:
+            key (K): The key to search for in the map.
+
+        Returns:
+            bool: True if the key is in the map. False, otherwise.
+
+        Examples:
+            >>> hm = MapOpenAddressing.from_items([('a', 1), ('b', 2), ('c', 3)])
+            >>> 'a' in hm
+            True
+            >>> 'd' in hm
+            False
+        """
+        return self._find(key) is not None
@@ -0,0 +1,201 @@
+from itertools import repeat
+from typing import Optional, cast
+
+from .map import LOAD_FACTOR
+
+
+class OpenAddressingTable[K, V]:
+    """Open-addressed hash table with Robin Hood probing, for keys and optional values.
+
+    Shared by MapOpenAddressing (keys and values) and Set (keys only).
+
+    Instead of chaining collisions into a per-bucket container, every entry lives
+    directly in the table. The hashes, keys, and values are stored in parallel lists
+    (one slot per index), so there are no per-bucket objects or (key, value) tuples to
+    chase. A keys-only table (e.g., Set) has no values list at all (_values is None).
+    A collided entry is placed in the next free slot (linear probing).
+
+    Robin Hood hashing keeps probe sequences short and even: each entry tracks its
+    distance from its ideal slot (its "distance from initial bucket", or DIB). When
+    inserting, if we pass an entry that is closer to its ideal slot than we are to
+    ours, we take its slot and continue inserting the displaced entry instead. This
+    also lets a lookup stop early once it passes an entry closer to home than itself.
+    Deletions shift the following entries back by one (backward-shift deletion), so
+    no tombstones are needed.
+
+    Storing the full hash lets most probes compare ints before comparing keys, and
+    lets the table grow without calling hash() again.
+    """
+
+    # Parallel slot arrays. An empty slot has a hash of None (any int is a valid hash).
+    _hashes: list[Optional[int]]
+    _keys: list[Optional[K]]
+    _values: Optional[list[Optional[V]]]  # None for a keys-only table.
+    _size: int
+
+    def _allocate(self, capacity: int, *, with_values: bool) -> None:
+        """Replace the slot arrays with empty ones of the given capacity.
+
+        Args:
+            capacity (int): The number of slots.
+            with_values (bool): Whether to allocate a values list (or keys only).
+        """
+        self._hashes = [None] * capacity
+        self._keys = [None] * capacity
+        self._values = [None] * capacity if with_values else None
+
+    def _capacity(self) -> int:
+        """The total capacity of the table (i.e., the number of slots)."""
+        return len(self._hashes)
+
+    def _find(self, key: K) -> Optional[int]:
+        """Get the slot index of the entry at the given key.
+
+        We probe from the key's ideal slot, comparing the stored hash before the key
+        (and, like the builtin dict, key identity before key equality).
+        The probe stops at an empty slot, or at an entry closer to its ideal slot than
+        we are to ours (Robin Hood insertion would have placed the key before it).
+
+        Args:
+            key (K): The key to search for.
+
+        Returns:
+            Optional[int]: The slot index of the entry, or None if not found.
+        """
+        hashes = self._hashes
+        keys = self._keys
+        hashed = hash(key)
+        capacity = len(hashes)
+        index = hashed % capacity
+        distance = 0
+        while (slot_hash := hashes[index]) is not None:
+            if slot_hash == hashed and (
+                (slot_key := keys[index]) is key or slot_key == key
+            ):
+                return index
+            if (index - slot_hash) % capacity < distance:
+                break
+            index = (index + 1) % capacity
+            distance += 1
+        return None
+
+    def _insert(self, key: K, value: Optional[V]) -> None:
+        """Insert an entry, or update the value of an existing key.
+
+        We probe for the key, and stop at the first empty slot or the first entry that
+        is closer to its ideal slot than we are (the key cannot be further along). The
+        new entry is then inserted from that point.
+
+        Args:
+            key (K): The key to add/set.
+            value (Optional[V]): The value to store. Ignored by a keys-only table.
+        """
+        hashes = self._hashes
+        keys = self._keys
+        hashed = hash(key)
+        capacity = len(hashes)
+        index = hashed % capacity
+        distance = 0
+        while (slot_hash := hashes[index]) is not None:
+            if slot_hash == hashed and (
+                (slot_key := keys[index]) is key or slot_key == key
+            ):
+                if self._values is not None:
+                    self._values[index] = value
+                return
+            if (index - slot_hash) % capacity < distance:
+                break  # Robin Hood invariant: the key is not in the table.
+            index = (index + 1) % capacity
+            distance += 1
+
+        self._place(index, distance, hashed, key, value)
+        self._size += 1
+        if self._size >= LOAD_FACTOR * capacity:
+            self._grow()
+
+    def _delete_at(self, index: int) -> None:
+        """Delete the entry in the given (occupied) slot.
+
+        Rather than leaving a tombstone, each following entry that is not in its ideal
+        slot is shifted back by one, until an empty slot or an entry already in its
+        ideal slot is reached.
+
+        Args:
+            index (int): The slot index of the entry to delete (see _find).
+        """
+        hashes = self._hashes
+        keys = self._keys
+        values = self._values
+        capacity = len(hashes)
+        following = (index + 1) % capacity
+        while (slot_hash := hashes[following]) is not None and (
+            following - slot_hash
+        ) % capacity:
+            hashes[index] = slot_hash
+            keys[index] = keys[following]
+            if values is not None:
+                values[index] = values[following]
+            index, following = following, (following + 1) % capacity
+
+        hashes[index] = None
+        keys[index] = None
+        if values is not None:
+            values[index] = None
+        self._size -= 1
+
+    def _place(
+        self, index: int, distance: int, hashed: int, key: K, value: Optional[V]
+    ) -> None:
+        """Insert an entry (known to be absent) by Robin Hood probing from a position.
+
+        Whenever the probe passes an entry closer to its ideal slot than the entry
+        being inserted, the two are swapped, and we continue placing the displaced one.
+
+        Args:
+            index (int): The slot to continue probing from.
+            distance (int): The inserted entry's distance from its ideal slot at index.
+            hashed (int): The hash of the key.
+            key (K): The key to insert.
+            value (Optional[V]): The value to insert. Ignored by a keys-only table.
+        """
+        hashes = self._hashes
+        keys = self._keys
+        values = self._values
+        capacity = len(hashes)
+        slot_key: Optional[K] = key
+        slot_value = value
+        while (slot_hash := hashes[index]) is not None:
+            slot_distance = (index - slot_hash) % capacity
+            if slot_distance < distance:
+                hashes[index], hashed = hashed, slot_hash
+                keys[index], slot_key = slot_key, keys[index]
+                if values is not None:
+                    values[index], slot_value = slot_value, values[index]
+                distance = slot_distance
+            index = (index + 1) % capacity
+            distance += 1
+
+        hashes[index] = hashed
+        keys[index] = slot_key
+        if values is not None:
+            values[index] = slot_value
+
+    def _grow(self) -> None:
+        """Grow the capacity of the table to be roughly double. All items are rehashed.
+
+        We follow the same capacity growth as the chaining maps (double and add one).
+        Entries are re-placed directly into the new slot arrays using their stored
+        hashes, so hash() is not called again and no keys are compared.
+
+        Complexity:
+            Time: O(n) to re-place all entries into the bigger table.
+            Space: O(n) due to holding the old slot arrays while re-placing.
+        """
+        hashes, keys, values = self._hashes, self._keys, self._values
+        capacity = self._capacity() * 2 + 1
+        self._allocate(capacity, with_values=values is not None)
+
+        entries = zip(hashes, keys, repeat(None) if values is None else values)
+        for hashed, key, value in entries:
+            if hashed is not None:
+                self._place(hashed % capacity, 0, hashed, cast(K, key), value)
@@ -1,31 +1,43 @@
-from typing import Iterable, Iterator, Self
+from operator import length_hint
+from typing import Iterable, Iterator, Self, cast
 
-from .map_list import MapList
+from .map import capacity_for
+from .open_addressing import OpenAddressingTable
 
-Map = MapList
 
+class Set[T](OpenAddressingTable[T, None]):
+    """HashSet data structure implemented using open addressing with Robin Hood probing.
 
-class Set[T]:
-    """HashSet data structure implemented using a Map[T, None].
+    The set uses the same table (and probing) as MapOpenAddressing, but is keys-only:
+    the set's values are stored as the table's keys, and there is no values list. So,
+    nothing is allocated per entry, and each slot is two list entries rather than
+    three. See OpenAddressingTable for details.
 
     Basic operations:
-     - add, in ~O(1), but really O(k) where k is the length of collided values. Worst
-         case, this is O(n) due to rehashing, but this is amortized.
-     - remove, in ~O(1), but really O(k) where k is the length of collided values.
-     - __contains__, in ~O(1), but really O(k) where k is the length of collided values.
+     - add, in ~O(1), but really O(k) where k is the probe length. Worst case, this is
+         O(n) due to rehashing, but this is amortized.
+     - remove, in ~O(1), but really O(k) where k is the probe length.
+     - __contains__, in ~O(1), but really O(k) where k is the probe length.
      - __iter__, in ~O(n).
     """
 
-    _hm: Map[T, None]
+    def __init__(self, /, capacity: int = 31):
+        """Create a new (empty) set.
 
-    def __init__(self):
-        """Create a new (empty) set."""
-        self._hm = Map()
+        Args:
+            capacity (int, optional): Give a custom capacity to initialize the set. This
+              value should be prime to maximize performance. Defaults to 31.
+        """
+        self._allocate(capacity, with_values=False)
+        self._size = 0
 
     @classmethod
     def from_iterable(cls, iterable: Iterable[T]) -> Self:
         """Create (and return) a new hash set from an iterable of values.
 
+        If the number of values is known in advance (e.g., iterable is a list), the set
+        is created with enough capacity to hold them all without growing.
+
         Args:
             iterable (Iterable[T]): An iterable of values to add into the new set.
 
@@ -37,7 +49,7 @@ class Set[T]:
             >>> list(sorted(s))
             [1, 2, 3]
         """
-        s = cls()
+        s = cls(capacity=capacity_for(length_hint(iterable)))
         for value in iterable:
             s.add(value)
         return s
@@ -56,7 +68,7 @@ class Set[T]:
             >>> list(sorted(s))
             [1, 2]
         """
-        self._hm[value] = None
+        self._insert(value, None)
 
     def remove(self, value: T) -> None:
         """Delete the value from the set.
@@ -73,7 +85,10 @@ class Set[T]:
             >>> 3 in s
             False
         """
-        del self._hm[value]
+        index = self._find(value)
+        if index is None:
+            raise KeyError("value not found in set")
+        self._delete_at(index)
 
     def __iter__(self) -> Iterator[T]:
         """Yields values stored in the set (in an arbitrary order).
@@ -86,7 +101,9 @@ class Set[T]:
             >>> list(sorted(s))
             [1, 2, 3]
         """
-        yield from self._hm.keys()
+        for slot_hash, value in zip(self._hashes, self._keys):
+            if slot_hash is not None:
+                yield cast(T, value)
 
     def __contains__(self, value: T) -> bool:
         """Return if a given value exists in the set.
@@ -104,7 +121,7 @@ class Set[T]:
             >>> 4 in s
             False
         """
-        return value in self._hm
+        return self._find(value) is not None
 
     def __len__(self) -> int:
         """Return the number of values in the set.
@@ -117,7 +134,7 @@ class Set[T]:
             >>> len(s)
             3
         """
-        return len(self._hm)
+        return self._size
 
     def __bool__(self) -> bool:
         """Returns true if the set has at least one value.
@@ -131,4 +148,4 @@ class Set[T]:
             >>> bool(Set())
             False
         """
-        return bool(self._hm)
+        return self._size > 0
@@ -1,3 +1,4 @@
+import heapq
 from abc import ABC, abstractmethod
 from typing import Iterable, Iterator, Optional, Self
 
@@ -13,7 +14,7 @@ class _Heap[CT: SupportsRichComparison](ABC):
 
     We use a list because the heap will always be a complete binary tree. We can
     traverse to parent/child "nodes" via index manipulation. Left and right children are
-    at 2i+1 and 2i+2, respectively. The parent node is at (i-2)//2.
+    at 2i+1 and 2i+2, respectively. The parent node is at (i-1)//2.
 
     Values must support a Comparable type (at least support __lt__ operation). For
     MinHeap, the highest priority element is the "smallest"; for MaxHeap it is the
@@ -23,6 +24,7 @@ class _Heap[CT: SupportsRichComparison](ABC):
      - from_iterable in O(n) time
      - push in O(logn) time
      - pop in O(logn) time
+     - pushpop / replace in O(logn) time (a fused push and pop)
      - peek in O(1) time
      - consume_all in O(nlogn) time (n pop operations)
      - private methods to sift_up, sift_down, and heapify
@@ -119,6 +121,74 @@ class _Heap[CT: SupportsRichComparison](ABC):
         self._sift_down(0)
         return value
 
+    def pushpop(self, value: CT) -> CT:
+        """Push a value into the heap, then pop (and return) the highest priority value.
+
+        This is faster than a push followed by a pop. If the value has higher priority
+        than the root, it would be popped straight back out, so the heap is unchanged.
+        Otherwise, the value replaces the root and only one _sift_down is needed.
+
+        Complexity:
+            Time: O(logn) to re-heapify (O(1) if the value is returned directly).
+
+        Args:
+            value (CT): The value to add into the heap.
+
+        Returns:
+            CT: The popped / removed value (possibly the given value).
+
+        Examples:
+            >>> heap = MinHeap.from_iterable([3, 1, 2])
+            >>> heap.pushpop(0)
+            0
+            >>> heap.pushpop(4)
+            1
+            >>> list(heap.consume_all())
+            [2, 3, 4]
+        """
+        heap = self._heap
+        if heap and self._compare(heap[0], value):
+            value, heap[0] = heap[0], value
+            self._sift_down(0)
+        return value
+
+    def replace(self, value: CT) -> Optional[CT]:
+        """Pop (and return) the highest priority value, then push a value into the heap.
+
+        This is faster than a pop followed by a push: the value replaces the root, and
+        only one _sift_down is needed. Unlike pushpop, the returned value is always from
+        the heap (even if the given value has higher priority).
+
+        Complexity:
+            Time: O(logn) to re-heapify.
+
+        Args:
+            value (CT): The value to add into the heap.
+
+        Returns:
+            Optional[CT]: The popped / removed value. If the heap is empty, the value is
+              pushed and None is returned.
+
+        Examples:
+            >>> heap = MinHeap.from_iterable([3, 1, 2])
+            >>> heap.replace(0)
+            1
+            >>> list(heap.consume_all())
+            [0, 2, 3]
+            >>> heap.replace(5)
+            >>> heap.peek()
+            5
+        """
+        heap = self._heap
+        if not heap:
+            heap.append(value)
+            return None
+
+        top = heap[0]
+        heap[0] = value
+        self._sift_down(0)
+        return top
+
     def peek(self) -> Optional[CT]:
         """Return the highest priority value in the heap (the front).
 
@@ -157,9 +227,12 @@ class _Heap[CT: SupportsRichComparison](ABC):
     def consume_all(self) -> Iterator[CT]:
         """Pop (and yield) values from the heap until the heap is empty.
 
-        Repeatedly calls pop to get the highest priority value from the heap until the
-        heap is empty. After this, the heap will be empty and is mutated by this
-        function. The returned values will be in sorted order due to the heap invariant.
+        Repeatedly pops the highest priority value from the heap until the heap is
+        empty. After this, the heap will be empty and is mutated by this function. The
+        returned values will be in sorted order due to the heap invariant.
+
+        The pop is inlined into the loop (moving the last value to the root and calling
+        _sift_down), rather than calling pop() and checking its result for None.
 
         Caution: If this iterator is not consumed, then the heap will still have values
         that could later be removed via the pop()s of this iterator.
@@ -175,8 +248,16 @@ class _Heap[CT: SupportsRichComparison](ABC):
             >>> list(heap.consume_all())
             [1, 2, 3, 4, 5]
         """
-        while (value := self.pop()) is not None:
-            yield value
+        heap = self._heap
+        while heap:
+            last = heap.pop()
+            if not heap:
+                yield last
+                return
+            top = heap[0]
+            heap[0] = last
+            self._sift_down(0)
+            yield top
 
     def __contains__(self, value: CT) -> bool:
         """Check if a given value exists in the heap.
@@ -215,182 +296,202 @@ class _Heap[CT: SupportsRichComparison](ABC):
     @abstractmethod
     def _compare(self, value1: CT, value2: CT) -> bool: ...
 
-    def _priority_child(self, i: int) -> Optional[int]:
-        """Returns the index of the (highest) priority child for the given node index.
-
-        Args:
-            i (int): The current node to find the (higher) priority child of.
-
-        Returns:
-            Optional[int]: The index of the child node with higher priority. There is no
-              guarantee that the returned child has a higher priority than the current
-              node. If no such child exists (e.g., leaf node), then None is returned.
-        """
-        left, right = _Heap._left_child(i), _Heap._right_child(i)
-        if left >= len(self):
-            return None
-        elif right >= len(self):
-            return left
-
-        if self._compare(self._heap[left], self._heap[right]):
-            return left
-        return right
-
-    def _sift_up(self, i: int) -> None:
+    def _sift_up(self, i: int, start: int = 0) -> None:
         """Sift/heapify nodes upwards until the heap invariant is restored.
 
         Only checks the heap invariant for the current node (i.e., stops when a node is
-        encountered with higher priority). Sifting means swapping the node with its
-        parent until the parent is higher priority.
+        encountered with higher priority). Rather than swapping the node with each
+        lower priority parent, we move the parents down one level into the "hole", and
+        write the node once at its final position.
 
         Complexity:
-            Time: O(logn) due to repeated swaps possibly the height of the heap.
+            Time: O(logn) due to moving up to the height of the heap.
 
         Args:
             i (int): The current index of the node to sift upwards.
+            start (int, optional): The index to stop sifting at (an ancestor of i).
+              Defaults to 0 (the root).
         """
-        while i > 0:
-            parent = _Heap._parent(i)
-            if self._compare(self._heap[parent], self._heap[i]):
-                return
-
-            self._swap(i, parent)
+        heap = self._heap
+        value = heap[i]
+        while i > start:
+            parent = (i - 1) // 2
+            if not self._compare(value, heap[parent]):
+                break
+            heap[i] = heap[parent]
             i = parent
+        heap[i] = value
 
     def _sift_down(self, i: int) -> None:
         """Sift/heapify nodes downwards until the heap invariant is restored.
 
-        Only checks the heap invariant for the current node (i.e., stops when a node is
-        encountered with lower priority). Sifting means swapping the node with the
-        higher priority of its two children (if that value is higher priority than
-        current).
+        This follows the approach of the stdlib heapq. The node at i is lifted out, and
+        the resulting "hole" is moved all the way down to a leaf, by always moving the
+        higher priority child up into it. That is one comparison per level (between the
+        two children), instead of also comparing against the sifted node at each level.
+        Then, the node is placed in the hole at the leaf and sifted back up.
+
+        Since the node usually came from the bottom of the heap (e.g., in pop), it most
+        likely belongs near the bottom again, so the final sift up is short.
 
         Complexity:
-            Time: O(logn) due to repeated swaps possibly the height of the heap.
+            Time: O(logn) due to moving down (and back up) the height of the heap.
 
         Args:
             i (int): The current index of the node to sift downwards.
         """
-        while i < len(self):
-            child = self._priority_child(i)
-            if not child or self._compare(self._heap[i], self._heap[child]):
-                return
-
-            self._swap(i, child)
+        heap = self._heap
+        size = len(heap)
+        start = i
+        value = heap[i]
+        child = 2 * i + 1  # Left child.
+        while child < size:
+            right = child + 1
+            if right < size and not self._compare(heap[child], heap[right]):
+                child = right
+            heap[i] = heap[child]
             i = child
+            child = 2 * i + 1
+        heap[i] = value
+        self._sift_up(i, start)
 
     def _heapify(self) -> None:
         """Heapify the entire heap array in-place.
 
-        Typically called from an unstructured input (e.g., from an iterable). Repeatedly
-        calls sift_down from the end of the array. This is more efficient than calling
-        sift_up.
+        Typically called from an unstructured input (e.g., from an iterable). This is
+        Floyd's bottom-up heap construction: sift down each parent node, from the last
+        parent back to the root. The second half of the array are all leaves (already
+        valid heaps), so we start from the last parent node.
+
+        The sift down is inlined here, and moves a hole down like _sift_down, but stops
+        as soon as the node has higher priority than both children. Most parents are
+        near the bottom of the heap, so most of these loops end after a level or two
+        (the pop-oriented _sift_down always walks to a leaf).
 
         Complexity:
             Time: O(n)
         """
-        for i in range(len(self) - 1, -1, -1):
-            self._sift_down(i)
+        heap = self._heap
+        size = len(heap)
+        for i in range(size // 2 - 1, -1, -1):
+            value = heap[i]
+            child = 2 * i + 1  # Left child.
+            while child < size:
+                right = child + 1
+                if right < size and not self._compare(heap[child], heap[right]):
+                    child = right
+                if not self._compare(heap[child], value):
+                    break
+                heap[i] = heap[child]
+                i = child
+                child = 2 * i + 1
+            heap[i] = value
 
-    def _swap(self, i: int, j: int) -> None:
-        """Swaps the positions of two indices in the heap.
 
-        Args:
-            i (int): The first node index to swap.
-            j (int): The second node index to swap.
-        """
-        self._heap[i], self._heap[j] = self._heap[j], self._heap[i]
+class MinHeap[CT: SupportsRichComparison](_Heap[CT]):
+    """MinHeap, where the smallest item is always at the front.
 
-    @staticmethod
-    def _parent(i: int) -> int:
-        """Return the index of the parent node of i.
+    The list layout and __lt__ ordering match the stdlib heapq exactly, so push, pop,
+    and heapify are delegated to heapq, which implements them in C.
 
-        Since the values are stored in a flat array, we use index manipulation to find
-        the parent/children of a given node.
+    Examples:
+        >>> min_heap = MinHeap[int].from_iterable([5, 1, 4, 3, 2])
+        >>> min_heap.peek()
+        1
+        >>> list(min_heap.consume_all())
+        [1, 2, 3, 4, 5]
+    """
+
+    def push(self, value: CT) -> None:
+        """Push a value into the heap, using heapq.heappush.
 
         Args:
-            i (int): The index of the value to find the parent of.
+            value (CT): The value to add into the heap.
+
+        Examples:
+            >>> heap = MinHeap()
+            >>> heap.push(3)
+            >>> heap.push(1)
+            >>> heap.peek()
+            1
+        """
+        heapq.heappush(self._heap, value)
+
+    def pop(self) -> Optional[CT]:
+        """Pop (and return) the smallest item from the heap, using heapq.heappop.
 
         Returns:
-            int: The index of the parent of the given node index. If 0 is given (root),
-              then an index of -1 will be returned (representing no parent).
+            Optional[CT]: The popped / removed value. If the heap is empty, return None.
 
         Examples:
-            >>> _Heap._parent(5)
-            2
-            >>> _Heap._parent(2)
-            0
-            >>> _Heap._parent(0)
-            -1
+            >>> heap = MinHeap.from_iterable([3, 1, 2])
+            >>> heap.pop()
+            1
+            >>> MinHeap().pop()
         """
-        return (i - 1) // 2
-
-    @staticmethod
-    def _left_child(i: int) -> int:
-        """Return the index of the left child node of i.
+        return heapq.heappop(self._heap) if self._heap else None
 
-        Since the values are stored in a flat array, we use index manipulation to find
-        the parent/children of a given node.
+    def pushpop(self, value: CT) -> CT:
+        """Push a value, then pop (and return) the smallest, using heapq.heappushpop.
 
         Args:
-            i (int): The index of the value to find the left child of.
+            value (CT): The value to add into the heap.
 
         Returns:
-            int: The index of the left child of the given node index. Possibly returns
-              values beyond the length of the heap, if the requested child does not
-              exist (e.g., leaf node).
+            CT: The popped / removed value (possibly the given value).
 
         Examples:
-            >>> _Heap._left_child(0)
+            >>> heap = MinHeap.from_iterable([3, 1, 2])
+            >>> heap.pushpop(4)
             1
-            >>> _Heap._left_child(1)
-            3
-            >>> _Heap._left_child(2)
-            5
         """
-        return i * 2 + 1
-
-    @staticmethod
-    def _right_child(i: int) -> int:
-        """Return the index of the right child node of i.
+        return heapq.heappushpop(self._heap, value)
 
-        Since the values are stored in a flat array, we use index manipulation to find
-        the parent/children of a given node.
+    def replace(self, value: CT) -> Optional[CT]:
+        """Pop (and return) the smallest, then push a value, using heapq.heapreplace.
 
         Args:
-            i (int): The index of the value to find the right child of.
+            value (CT): The value to add into the heap.
 
         Returns:
-            int: The index of the right child of the given node index. Possibly returns
-              values beyond the length of the heap, if the requested child does not
-              exist (e.g., leaf node).
+            Optional[CT]: The popped / removed value. If the heap is empty, the value is
+              pushed and None is returned.
 
         Examples:
-            >>> _Heap._right_child(0)
-            2
-            >>> _Heap._right_child(1)
-            4
-            >>> _Heap._right_child(2)
-            6
+            >>> heap = MinHeap.from_iterable([3, 1, 2])
+            >>> heap.replace(0)
+            1
+            >>> heap.peek()
+            0
         """
-        return i * 2 + 2
+        if not self._heap:
+            self._heap.append(value)
+            return None
+        return heapq.heapreplace(self._heap, value)
 
+    def consume_all(self) -> Iterator[CT]:
+        """Pop (and yield) values from the heap until it is empty, using heapq.heappop.
 
-class MinHeap[CT: SupportsRichComparison](_Heap[CT]):
-    """MinHeap, where the smallest item is always at the front.
+        Yields:
+            Iterator[CT]: An iterator over values in the heap, in ascending order.
 
-    Examples:
-        >>> min_heap = MinHeap[int].from_iterable([5, 1, 4, 3, 2])
-        >>> min_heap.peek()
-        1
-        >>> list(min_heap.consume_all())
-        [1, 2, 3, 4, 5]
-    """
+        Examples:
+            >>> heap = MinHeap.from_iterable([5, 1, 3, 2, 4])
+            >>> list(heap.consume_all())
+            [1, 2, 3, 4, 5]
+        """
+        heap = self._heap
+        while heap:
+            yield heapq.heappop(heap)
 
     def _compare(self, value1: CT, value2: CT) -> bool:
         """Use __lt__ ordering to construct a min-heap."""
         return value1 < value2
 
+    def _heapify(self) -> None:
+        """Heapify the entire heap array in-place, using heapq.heapify."""
+        heapq.heapify(self._heap)
+
 
 class MaxHeap[CT: SupportsRichComparison](_Heap[CT]):
     """MaxHeap, where the largest item is always at the front.
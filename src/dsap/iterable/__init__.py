@@ -2,11 +2,12 @@ from .adjacent_transform import adjacent_transform, pairwise_transform
 from .reduce import reduce
 from .reverse import reverse
 from .rotate import rotate
-from .scan import scan
+from .scan import exclusive_scan, scan
 from .skip import skip
 
 __all__ = [
     "adjacent_transform",
+    "exclusive_scan",
     "pairwise_transform",
     "reduce",
     "reverse",
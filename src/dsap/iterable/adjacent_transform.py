@@ -1,6 +1,6 @@
 import operator
-from itertools import tee
-from typing import Callable, Iterable, Iterator, Tuple
+from itertools import islice, tee
+from typing import Callable, Iterable, Iterator, Sequence, Tuple
 
 from .skip import skip
 
@@ -66,15 +66,28 @@ def pairwise_transform[T, U](
     Similar / equivalent algorithms: itertools.pairwise, adjacent_transform, sliding
     window.
 
+    If the input is a Sequence, we can iterate it twice directly (offsetting the second
+    pass with islice). We return a lazy map over the two passes, so the pairwise loop
+    runs inside the builtin map (in C) without resuming a Python generator frame for
+    every element.
+
+    One-shot iterables (e.g., generators) cannot be iterated twice. Instead of tee'ing
+    them, we walk a single iterator and remember the previous element, so only one
+    next() call is needed per element and no (previous, current) tuple is built.
+
+    Complexity:
+        Time: O(n)
+        Space: O(1), the input is never copied or buffered
+
     Args:
         iterable (Iterable[T]): Input values, which will be traversed in pairs.
         function (Callable[[T, T], U], optional): Function to call on each pair of
           values. The first and second values will be adjacent in the input iterable
           (i.e., (iterable[i], iterable[i+1])). Defaults to operator.add.
 
-    Yields:
-        Iterator[U]: Generated values. The length of the output iterator will be one
-        less than the input iterator.
+    Returns:
+        Iterator[U]: Lazily generated values. The length of the output iterator will be
+        one less than the input iterator.
 
     Examples:
         >>> list(pairwise_transform([15, 10, 6, 3, 1]))
@@ -84,9 +97,30 @@ def pairwise_transform[T, U](
         >>> list(pairwise_transform([10]))
         []
     """
+    if isinstance(iterable, Sequence):
+        return map(function, iterable, islice(iterable, 1, None))
+    return _pairwise_transform_iterator(iter(iterable), function)
+
 
-    # We need to adjust the argument shape to use the generic adjacent_transform.
-    def tuple_function(values: tuple[T, ...]) -> U:
-        return function(*values)
+def _pairwise_transform_iterator[T, U](
+    iterator: Iterator[T], function: Callable[[T, T], U]
+) -> Iterator[U]:
+    """Generator for pairwise_transform over a one-shot iterator.
+
+    Args:
+        iterator (Iterator[T]): Input values, which will be traversed in pairs.
+        function (Callable[[T, T], U]): Function to call on each (previous, current)
+          pair of values.
+
+    Yields:
+        Iterator[U]: Generated values, one fewer than the input iterator.
+    """
+    # Take the first element without raising (and catching) StopIteration.
+    for previous in iterator:
+        break
+    else:
+        return  # Not enough elements to access pairwise.
 
-    yield from adjacent_transform(iterable, tuple_function, 2)
+    for current in iterator:
+        yield function(previous, current)
+        previous = current
@@ -1,3 +1,5 @@
+import functools
+import math
 import operator
 from typing import Callable, Iterable, Optional
 
@@ -7,14 +9,27 @@ def reduce[T](
     function: Callable[[T, T], T] = operator.add,
     *,
     initial: Optional[T] = None,
+    absorbing: Optional[T] = None,
 ) -> Optional[T]:
     """Perform a reduction algorithm on the given iterable.
 
     Similar / related algorithms: functools.reduce, fold (fold_left, fold_right),
     accumulate, aggregate, compress.
 
+    For the common operator.mul reduction, we delegate the loop to math.prod, which
+    multiplies left to right in C (giving the same result as repeated multiplication).
+    The builtin sum is not used for operator.add, since it uses compensated summation
+    for floats, which would change the result of the fold. Any other function is driven
+    by functools.reduce, which still runs the loop in C (only the function call itself
+    executes Python code).
+
+    If an absorbing element is given (e.g., 0 for multiplication, False for logical
+    and), the reduction stops as soon as the accumulator equals it, since no further
+    values can change the result. This is a generalization of the short-circuiting of
+    all() / any().
+
     Complexity:
-        Time: O(n)
+        Time: O(n), or O(k) with an absorbing element first reached at index k
         Space: O(1)
 
     Args:
@@ -25,6 +40,9 @@ def reduce[T](
         initial (Optional[T], optional): An initial value for the accumulator. If
           given, the output will start with this value and be one longer than the input
           iterable. Defaults to None.
+        absorbing (Optional[T], optional): An absorbing element of the function. Once
+          the accumulator equals this value, it is returned without consuming the rest
+          of the iterable. Defaults to None (always reduce the entire iterable).
 
     Returns
         T: Result of the reduction. If the input is empty, initial is returned (possibly
@@ -38,6 +56,11 @@ def reduce[T](
         >>> reduce([1, 1, 1], operator.mul, initial=100)
         100
         >>> reduce([])
+        >>> values = iter([2, 0, 3, 4])
+        >>> reduce(values, operator.mul, absorbing=0)
+        0
+        >>> list(values)
+        [3, 4]
     """
     iterator = iter(iterable)
     if initial is not None:
@@ -48,6 +71,16 @@ def reduce[T](
         except StopIteration:
             return initial  # Iterator is empty
 
-    for item in iterator:
-        total = function(total, item)
-    return total
+    if absorbing is not None:
+        if total == absorbing:
+            return total
+        for item in iterator:
+            total = function(total, item)
+            if total == absorbing:
+                return total
+        return total
+
+    if function is operator.mul:
+        return math.prod(iterator, start=total)  # type: ignore[call-overload]
+
+    return functools.reduce(function, iterator, total)
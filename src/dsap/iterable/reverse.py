@@ -10,9 +10,16 @@ def reverse[T](
     input array. This function mutates the input argument, and returns it as well.
     Similar/related algorithms: list.reverse, reversed, list[::-1].
 
+    When the whole sequence is reversed, we defer to its own reverse() method, which is
+    implemented in C for builtin sequences (list, collections.deque, bytearray,
+    array.array). For windows of builtin lists (and bytearrays), we reverse with a
+    single slice assignment, which copies the element pointers in C instead of swapping
+    one pair at a time in Python. Other mutable sequences fall back to the swapping
+    algorithm.
+
     Complexity:
         Time: O(n), n/2 total swaps, where n = end - start
-        Space: O(1), in-place algorithm
+        Space: O(1), in-place algorithm (O(n) temporary copy for the list fast path)
 
     Args:
         array (MutableSequence[T]): Input sequence to reverse. The input array will be
@@ -39,6 +46,13 @@ def reverse[T](
     if end is None or end > len(array):
         end = len(array)
 
+    if start == 0 and end == len(array):
+        array.reverse()
+        return array
+    if isinstance(array, (list, bytearray)):
+        array[start:end] = array[start:end][::-1]
+        return array
+
     for i in range((end - start) // 2):
         array[start + i], array[end - i - 1] = array[end - i - 1], array[start + i]
     return array
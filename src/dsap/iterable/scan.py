@@ -1,5 +1,7 @@
 import operator
-from typing import Callable, Iterable, Iterator, Optional
+from itertools import accumulate, pairwise
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Optional, cast, overload
 
 
 def scan[T](
@@ -16,6 +18,10 @@ def scan[T](
     Similar / related algorithms: itertools.accumulate, inclusive/exclusive scan, prefix
     sum, cumulative sum, partial sums.
 
+    The accumulation loop is delegated to itertools.accumulate, which drives the
+    iterator and calls the function from C. For builtin operators (e.g., operator.add
+    on numbers), no Python bytecode runs per element at all.
+
     Complexity:
         Time: O(n)
         Space: O(1)
@@ -29,9 +35,9 @@ def scan[T](
           given, the output will start with this value and be one longer than the input
           iterable. Defaults to None.
 
-    Yields:
-        Iterator[T | U]: Generated values. If initial is given, the first value generated
-          will be initial and the output will be one longer than the input.
+    Returns:
+        Iterator[T | U]: Lazily generated values. If initial is given, the first value
+          generated will be initial and the output will be one longer than the input.
 
     Examples:
         >>> list(scan([1, 2, 3, 4, 5]))
@@ -43,16 +49,72 @@ def scan[T](
         >>> list(scan([]))
         []
     """
-    iterator = iter(iterable)
-    if initial is not None:
-        total = initial
-    else:
-        try:
-            total = next(iterator)
-        except StopIteration:
-            return  # Iterator is empty
-
-    yield total
-    for item in iterator:
-        total = function(total, item)
-        yield total
+    return accumulate(iterable, function, initial=initial)
+
+
+@overload
+def exclusive_scan[N: (int, float)](
+    iterable: Iterable[N], function: Callable[[N, N], N] = ...
+) -> Iterator[N]: ...
+
+
+@overload
+def exclusive_scan[T](
+    iterable: Iterable[T], function: Callable[[T, T], T] = ..., *, initial: T
+) -> Iterator[T]: ...
+
+
+def exclusive_scan[T](
+    iterable: Iterable[T],
+    function: Callable[[T, T], T] = operator.add,
+    *,
+    initial: T | int = 0,
+) -> Iterator[T]:
+    """Generate exclusive accumulated values from an iterable (exclusive left scan).
+
+    The i-th output is the accumulation of initial with the first i inputs, so the
+    i-th input is excluded from its own output. The output is the same length as the
+    input: it starts with initial and leaves off the final total. This is scan (an
+    inclusive scan) shifted right by one.
+
+    Similar / related algorithms: itertools.accumulate, inclusive/exclusive scan, prefix
+    sum, std::exclusive_scan.
+
+    We run the inclusive accumulate (with initial) and drop its last value by taking
+    the first of each adjacent pair. Both steps are itertools, so the loop runs in C.
+    To produce an output, the next input must already be read (one item of lookahead).
+
+    Complexity:
+        Time: O(n)
+        Space: O(1)
+
+    Args:
+        iterable (Iterable[T]): Input values to accumulate. Can be empty.
+        function (Callable[[T, T], T], optional): Function to call on each value. The
+          first argument will be the accumulator, and the second argument will be the
+          new value from the iterable. Defaults to operator.add.
+        initial (T, optional): The initial value for the accumulator, which is always
+          the first value generated (for a non-empty input). Should be the identity of
+          function. Defaults to 0, so it may only be omitted for int or float inputs.
+
+    Returns:
+        Iterator[T]: Lazily generated values, the same length as the input.
+
+    Raises:
+        ValueError: If initial is None. Unlike scan, there is no "no initial" case,
+          since the first value generated is always initial.
+
+    Examples:
+        >>> list(exclusive_scan([1, 2, 3, 4, 5]))
+        [0, 1, 3, 6, 10]
+        >>> list(exclusive_scan([1, 2, 3, 4], operator.mul, initial=1))
+        [1, 1, 2, 6]
+        >>> list(exclusive_scan([]))
+        []
+    """
+    if initial is None:
+        raise ValueError("exclusive_scan requires an initial value (got None)")
+
+    # The default of 0 is only selected by the int / float overload, where it is a T.
+    start = cast(T, initial)
+    return map(itemgetter(0), pairwise(accumulate(iterable, function, initial=start)))
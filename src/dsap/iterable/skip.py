@@ -1,9 +1,14 @@
+from itertools import islice
 from typing import Iterator
 
 
 def skip[T](iterator: Iterator[T], n: int = 1) -> Iterator[T]:
     """Advance (and return) an iterator by n elements.
 
+    The elements are consumed by islice (in C), rather than calling next() n times in
+    a Python loop. Only the last skipped element is pulled with next(), so a too-short
+    iterator still raises StopIteration.
+
     Args:
         iterator (Iterator[T]): The iterator to advance.
         n (int, optional): Consume this many elements from the iterator. If 0 or less,
@@ -26,6 +31,8 @@ def skip[T](iterator: Iterator[T], n: int = 1) -> Iterator[T]:
     if n < 0:
         raise ValueError("cannot skip iterator negative elements")
 
-    for _ in range(n):
-        next(iterator)
+    if n == 1:
+        next(iterator)  # Cheaper than building an islice for the default case.
+    elif n:
+        next(islice(iterator, n - 1, None))
     return iterator
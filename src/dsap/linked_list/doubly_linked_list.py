@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 
 from .linked_list import LinkedListBase
 
@@ -12,6 +12,8 @@ class DoublyLinkedList[T](LinkedListBase[T]):
       - DoublyLinkedList.from_iterable, O(n) (static method)
       - push_head, O(1)
       - push_tail, O(1)
+      - extend_head, O(k) for k values
+      - extend_tail, O(k) for k values
       - remove_head, O(1)
       - remove_tail, O(1)
       - remove, O(n)
@@ -21,12 +23,16 @@ class DoublyLinkedList[T](LinkedListBase[T]):
     """
 
     class _Node[U](LinkedListBase.NodeBase[U]):
+        __slots__ = ("data", "next", "prev")
+
         data: U
-        prev: Optional[DoublyLinkedList._Node[U]] = None
-        next: Optional[DoublyLinkedList._Node[U]] = None
+        prev: Optional[DoublyLinkedList._Node[U]]
+        next: Optional[DoublyLinkedList._Node[U]]
 
         def __init__(self, data: U):
             self.data = data
+            self.prev = None
+            self.next = None
 
     _head: Optional[_Node[T]]
     _tail: Optional[_Node[T]]
@@ -85,6 +91,61 @@ class DoublyLinkedList[T](LinkedListBase[T]):
             self._tail = node
         self._size += 1
 
+    def extend_head(self, iterable: Iterable[T]) -> None:
+        """Insert all values from an iterable into the front/head of the linked list.
+
+        The values keep their order, such that the linked list starts with the values
+        of the iterable. The new nodes are linked into a chain first, which is then
+        spliced in front of the head (updating the size only once).
+
+        Args:
+            iterable (Iterable[T]): Values to insert into the linked list.
+
+        Examples:
+            >>> linked_list = DoublyLinkedList.from_iterable([3, 4])
+            >>> linked_list.extend_head([1, 2])
+            >>> print(linked_list)
+            1->2->3->4->None
+        """
+        head, tail, size = self._chain(iterable)
+        if head is None or tail is None:
+            return
+
+        if self._head is None:
+            self._tail = tail
+        else:
+            tail.next = self._head
+            self._head.prev = tail
+        self._head = head
+        self._size += size
+
+    def extend_tail(self, iterable: Iterable[T]) -> None:
+        """Insert all values from an iterable into the back/tail of the linked list.
+
+        Rather than calling push_tail for each value, the new nodes are linked into a
+        chain first, which is then spliced after the tail (updating the size only once).
+
+        Args:
+            iterable (Iterable[T]): Values to insert into the linked list.
+
+        Examples:
+            >>> linked_list = DoublyLinkedList.from_iterable([1, 2])
+            >>> linked_list.extend_tail([3, 4])
+            >>> print(linked_list)
+            1->2->3->4->None
+        """
+        head, tail, size = self._chain(iterable)
+        if head is None or tail is None:
+            return
+
+        if self._tail is None:
+            self._head = head
+        else:
+            head.prev = self._tail
+            self._tail.next = head
+        self._tail = tail
+        self._size += size
+
     def remove_head(self) -> None:
         """Remove a node from the front/head of the linked list (if one exists).
 
@@ -96,7 +157,7 @@ class DoublyLinkedList[T](LinkedListBase[T]):
         """
         if self._head is None:
             return
-        if self._head == self._tail:
+        if self._head is self._tail:
             self._head = self._tail = None
             self._size -= 1
             return
@@ -117,7 +178,7 @@ class DoublyLinkedList[T](LinkedListBase[T]):
         """
         if self._tail is None:
             return
-        if self._head == self._tail:
+        if self._head is self._tail:
             self._head = self._tail = None
             self._size -= 1
             return
@@ -146,9 +207,9 @@ class DoublyLinkedList[T](LinkedListBase[T]):
             if node.data != value:
                 continue
 
-            if node == self._head:
+            if node is self._head:
                 self.remove_head()
-            elif node == self._tail:
+            elif node is self._tail:
                 self.remove_tail()
             else:
                 before, after = node.prev, node.next
@@ -159,6 +220,56 @@ class DoublyLinkedList[T](LinkedListBase[T]):
                 self._size -= 1
             return
 
+    def __iter__(self) -> Iterator[T]:
+        """Iterator that yields values in order from the head to the tail.
+
+        Walks the nodes directly, rather than through node_iterator, so each value is
+        produced by a single generator.
+
+        Yields:
+            Iterator[T]: Values of nodes in the linked list.
+
+        Examples:
+            >>> list(DoublyLinkedList.from_iterable([1, 2, 3]))
+            [1, 2, 3]
+        """
+        current = self._head
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    @staticmethod
+    def _chain(
+        iterable: Iterable[T],
+    ) -> tuple[Optional[_Node[T]], Optional[_Node[T]], int]:
+        """Link the values of an iterable into a new (detached) chain of nodes.
+
+        The prev/next links are set in a local loop, without touching the linked list.
+
+        Args:
+            iterable (Iterable[T]): Values to link into nodes.
+
+        Returns:
+            tuple[Optional[_Node[T]], Optional[_Node[T]], int]: The (head, tail, size)
+              of the chain. The head and tail are None if the iterable is empty.
+        """
+        iterator = iter(iterable)
+        for first in iterator:
+            break
+        else:
+            return None, None, 0  # Iterable is empty.
+
+        Node = DoublyLinkedList._Node
+        head = tail = Node(first)
+        size = 1
+        for value in iterator:
+            node = Node(value)
+            node.prev = tail
+            tail.next = node
+            tail = node
+            size += 1
+        return head, tail, size
+
     def node_iterator(self) -> Iterator[_Node[T]]:
         """Iterator that yields Nodes in order from the head to the tail.
 
@@ -166,7 +277,7 @@ class DoublyLinkedList[T](LinkedListBase[T]):
             Iterator[_Node[T]]: Nodes in the linked list.
         """
         current = self._head
-        while current:
+        while current is not None:
             yield current
             current = current.next
 
@@ -183,6 +294,6 @@ class DoublyLinkedList[T](LinkedListBase[T]):
         """
         previous = None
         current = self._head
-        while current:
+        while current is not None:
             yield previous, current
             previous, current = current, current.next
@@ -6,6 +6,10 @@ from typing import Callable, Iterable, Iterator, Optional, Self
 
 class LinkedListBase[T](ABC):
     class NodeBase[U]:
+        # Nodes are allocated per value, so subclasses declare their attributes in
+        # __slots__ (no per-node __dict__).
+        __slots__ = ()
+
         data: U
 
     _size: int
@@ -23,8 +27,7 @@ class LinkedListBase[T](ABC):
               len(iterable).
         """
         linked_list = cls()
-        for value in iterable:
-            linked_list.push_tail(value)
+        linked_list.extend_tail(iterable)
         return linked_list
 
     @abstractmethod
@@ -33,6 +36,33 @@ class LinkedListBase[T](ABC):
     @abstractmethod
     def push_tail(self, value: T) -> None: ...
 
+    def extend_head(self, iterable: Iterable[T]) -> None:
+        """Insert all values from an iterable into the front/head of the linked list.
+
+        The values keep their order, such that the linked list starts with the values
+        of the iterable (unlike calling push_head for each value, which reverses them).
+
+        Subclasses should override this to link the new nodes directly, and update the
+        head and size only once.
+
+        Args:
+            iterable (Iterable[T]): Values to insert into the linked list.
+        """
+        for value in reversed(list(iterable)):
+            self.push_head(value)
+
+    def extend_tail(self, iterable: Iterable[T]) -> None:
+        """Insert all values from an iterable into the back/tail of the linked list.
+
+        Subclasses should override this to link the new nodes directly, and update the
+        tail and size only once.
+
+        Args:
+            iterable (Iterable[T]): Values to insert into the linked list.
+        """
+        for value in iterable:
+            self.push_tail(value)
+
     @abstractmethod
     def remove_head(self) -> None: ...
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional, cast
 
 from .linked_list import LinkedListBase
 
@@ -12,8 +12,10 @@ class SinglyLinkedList[T](LinkedListBase[T]):
       - SinglyLinkedList.from_iterable, O(n) (static method)
       - push_head, O(1)
       - push_tail, O(1)
+      - extend_head, O(k) for k values
+      - extend_tail, O(k) for k values
       - remove_head, O(1)
-      - remove_tail, O(n) due to singly-linked list
+      - remove_tail, O(n) due to singly-linked list (O(1) right after push_tail)
       - remove, O(n)
       - __contains__, O(n)
       - __len__, O(1) (pre-computed)
@@ -21,19 +23,27 @@ class SinglyLinkedList[T](LinkedListBase[T]):
     """
 
     class _Node[U](LinkedListBase.NodeBase[U]):
+        __slots__ = ("data", "next")
+
         data: U
-        next: Optional[SinglyLinkedList._Node[U]] = None
+        next: Optional[SinglyLinkedList._Node[U]]
 
         def __init__(self, data: U):
             self.data = data
+            self.next = None
 
     _head: Optional[_Node[T]]
     _tail: Optional[_Node[T]]
+    # A cached pointer to the node before the tail (or None, if unknown). Nodes have no
+    # link to the previous node, so this lets remove_tail skip the O(n) walk from the
+    # head (e.g., when removing right after pushing to the tail).
+    _prev_tail: Optional[_Node[T]]
     _size: int
 
     def __init__(self):
         self._head = None
         self._tail = None
+        self._prev_tail = None
         self._size = 0
 
     def push_head(self, value: T) -> None:
@@ -55,6 +65,8 @@ class SinglyLinkedList[T](LinkedListBase[T]):
         if self._head is None:
             self._head = self._tail = node
         else:
+            if self._head is self._tail:
+                self._prev_tail = node
             node.next = self._head
             self._head = node
         self._size += 1
@@ -79,9 +91,67 @@ class SinglyLinkedList[T](LinkedListBase[T]):
             self._head = self._tail = node
         else:
             self._tail.next = node
+            self._prev_tail = self._tail
             self._tail = node
         self._size += 1
 
+    def extend_head(self, iterable: Iterable[T]) -> None:
+        """Insert all values from an iterable into the front/head of the linked list.
+
+        The values keep their order, such that the linked list starts with the values
+        of the iterable. The new nodes are linked into a chain first, which is then
+        spliced in front of the head (updating the size only once).
+
+        Args:
+            iterable (Iterable[T]): Values to insert into the linked list.
+
+        Examples:
+            >>> linked_list = SinglyLinkedList.from_iterable([3, 4])
+            >>> linked_list.extend_head([1, 2])
+            >>> print(linked_list)
+            1->2->3->4->None
+        """
+        head, tail, size = self._chain(iterable)
+        if head is None or tail is None:
+            return
+
+        if self._head is None:
+            self._tail = tail
+            self._prev_tail = None
+        else:
+            if self._head is self._tail:
+                self._prev_tail = tail
+            tail.next = self._head
+        self._head = head
+        self._size += size
+
+    def extend_tail(self, iterable: Iterable[T]) -> None:
+        """Insert all values from an iterable into the back/tail of the linked list.
+
+        Rather than calling push_tail for each value, the new nodes are linked into a
+        chain first, which is then spliced after the tail (updating the size only once).
+
+        Args:
+            iterable (Iterable[T]): Values to insert into the linked list.
+
+        Examples:
+            >>> linked_list = SinglyLinkedList.from_iterable([1, 2])
+            >>> linked_list.extend_tail([3, 4])
+            >>> print(linked_list)
+            1->2->3->4->None
+        """
+        head, tail, size = self._chain(iterable)
+        if head is None or tail is None:
+            return
+
+        if self._tail is None:
+            self._head = head
+        else:
+            self._tail.next = head
+        self._tail = tail
+        self._prev_tail = None  # Unknown, unless found by the next remove_tail walk.
+        self._size += size
+
     def remove_head(self) -> None:
         """Remove a node from the front/head of the linked list (if one exists).
 
@@ -93,16 +163,28 @@ class SinglyLinkedList[T](LinkedListBase[T]):
         """
         if self._head is None:
             return
-        if self._head == self._tail:
+        if self._head is self._tail:
             self._head = self._tail = None
             self._size -= 1
             return
+        if self._head is self._prev_tail:
+            self._prev_tail = None
         self._head = self._head.next
         self._size -= 1
 
     def remove_tail(self) -> None:
         """Remove a node from the back/tail of the linked list (if one exists).
 
+        Nodes have no link to the previous node, so we must find the node before the
+        tail. If it is cached (e.g., the tail was just pushed), this takes O(1) time.
+        Otherwise, we walk from the head, which is O(n). The walk also finds the node
+        before the new tail, so a run of removals only walks every other time. Use a
+        DoublyLinkedList (or a Deque) for repeated removals from the tail.
+
+        Complexity:
+            Time: O(1) if the node before the tail is cached. Otherwise, O(n) to find
+              the new tail.
+
         Examples:
             >>> linked_list = SinglyLinkedList.from_iterable([1, 2, 3])
             >>> linked_list.remove_tail()
@@ -111,18 +193,23 @@ class SinglyLinkedList[T](LinkedListBase[T]):
         """
         if self._head is None:
             return
-        if self._head == self._tail:
+        tail = self._tail
+        if self._head is tail:
             self._head = self._tail = None
             self._size -= 1
             return
 
-        for previous, current in self.pairwise_iterator():
-            if current == self._tail:
-                if previous is not None:
-                    previous.next = None
-                self._tail = previous
-                self._size -= 1
-                return
+        previous = self._prev_tail
+        before = None
+        if previous is None or previous.next is not tail:
+            previous = self._head
+            while previous.next is not tail:
+                before = previous
+                previous = cast("SinglyLinkedList._Node[T]", previous.next)
+        previous.next = None
+        self._tail = previous
+        self._prev_tail = before
+        self._size -= 1
 
     def remove(self, value: T) -> None:
         """Remove the first occurrence of a node with value in the linked list.
@@ -143,16 +230,94 @@ class SinglyLinkedList[T](LinkedListBase[T]):
             if current.data != value:
                 continue
 
-            if current == self._head:
+            if current is self._head:
                 self.remove_head()
-            elif current == self._tail:
+            elif current is self._tail:
+                self._prev_tail = previous  # Found the node before the tail already.
                 self.remove_tail()
             else:
                 if previous:
                     previous.next = current.next
+                if current is self._prev_tail:
+                    self._prev_tail = previous
                 self._size -= 1
             return
 
+    def __contains__(self, value: T) -> bool:
+        """Check if the SinglyLinkedList contains a node with given value.
+
+        Walks the nodes in a plain loop, rather than searching the values produced by a
+        generator (like the LinkedListBase default).
+
+        Args:
+            value (T): The value to search for.
+
+        Returns:
+            bool: True if the value is found. Otherwise, returns False.
+
+        Examples:
+            >>> linked_list = SinglyLinkedList.from_iterable([1, 2, 3])
+            >>> 2 in linked_list
+            True
+            >>> 4 in linked_list
+            False
+        """
+        current = self._head
+        while current is not None:
+            if current.data == value:
+                return True
+            current = current.next
+        return False
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterator that yields values in order from the head to the tail.
+
+        Walks the nodes directly, rather than through node_iterator, so each value is
+        produced by a single generator.
+
+        Yields:
+            Iterator[T]: Values of nodes in the linked list.
+
+        Examples:
+            >>> list(SinglyLinkedList.from_iterable([1, 2, 3]))
+            [1, 2, 3]
+        """
+        current = self._head
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    @staticmethod
+    def _chain(
+        iterable: Iterable[T],
+    ) -> tuple[Optional[_Node[T]], Optional[_Node[T]], int]:
+        """Link the values of an iterable into a new (detached) chain of nodes.
+
+        The next links are set in a local loop, without touching the linked list.
+
+        Args:
+            iterable (Iterable[T]): Values to link into nodes.
+
+        Returns:
+            tuple[Optional[_Node[T]], Optional[_Node[T]], int]: The (head, tail, size)
+              of the chain. The head and tail are None if the iterable is empty.
+        """
+        iterator = iter(iterable)
+        for first in iterator:
+            break
+        else:
+            return None, None, 0  # Iterable is empty.
+
+        Node = SinglyLinkedList._Node
+        head = tail = Node(first)
+        size = 1
+        for value in iterator:
+            node = Node(value)
+            tail.next = node
+            tail = node
+            size += 1
+        return head, tail, size
+
     def node_iterator(self) -> Iterator[_Node[T]]:
         """Iterator that yields Nodes in order from the head to the tail.
 
@@ -160,7 +325,7 @@ class SinglyLinkedList[T](LinkedListBase[T]):
             Iterator[_Node[T]]: Nodes in the linked list.
         """
         current = self._head
-        while current:
+        while current is not None:
             yield current
             current = current.next
 
@@ -177,6 +342,6 @@ class SinglyLinkedList[T](LinkedListBase[T]):
         """
         previous = None
         current = self._head
-        while current:
+        while current is not None:
             yield previous, current
             previous, current = current, current.next
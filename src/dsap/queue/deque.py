@@ -1,6 +1,5 @@
-from typing import Iterable, Iterator, Optional, Self
-
-from dsap.iterable import rotate
+from itertools import chain, islice
+from typing import Iterable, Iterator, Optional, Self, cast
 
 
 class Deque[T]:
@@ -28,8 +27,9 @@ class Deque[T]:
     # ring buffer for amortized O(1) push from both sides, and space efficiency. We
     # manage the ring buffer via a _start and _size. The _start may not be at index 0,
     # and the elements may wrap around the end of the ring buffer. To ensure consistent
-    # data storage, we perform _normalize(), _grow(), and _index() operations to remap
-    # indexing and grow the capacity without invalidating the data.
+    # data storage, we remap each logical offset modulo the capacity (inlined in the
+    # push / pop methods), and _grow() the capacity by copying the (one or two)
+    # contiguous slices of elements once, to the start of the bigger ring buffer.
     _ring_buffer: list[Optional[T]]
     _start: int  # Index representing the head / start of the ring buffer.
     _size: int
@@ -43,9 +43,9 @@ class Deque[T]:
     def from_iterable(cls, iterable: Iterable[T]) -> Self:
         """Build a new deque to contain the elements from the given iterable.
 
-        Elements will be inserted from the iterable by repeatedly calling push_back for
-        each value in order. Therefore, the first value of the iterable will become the
-        front of the deque, and the last value will become the back of the deque.
+        Elements will be inserted from the iterable in order (see extend). Therefore,
+        the first value of the iterable will become the front of the deque, and the last
+        value will become the back of the deque.
 
         Args:
             iterable (Iterable[T]): The values to insert into a new deque.
@@ -59,8 +59,7 @@ class Deque[T]:
             [1, 2, 3]
         """
         deque = cls()
-        for value in iterable:
-            deque.push_back(value)
+        deque.extend(iterable)
         return deque
 
     def push_front(self, value: T) -> None:
@@ -69,12 +68,12 @@ class Deque[T]:
         After inserting the element, the element will now be the first element in the
         deque, aka, the front.
 
-        If the deque is at capacity (len(deque) == deque.capacity()), we normalize and
-        grow the deque such that the capacity can hold the additional element.
+        If the deque is at capacity (len(deque) == deque.capacity()), we grow the deque
+        such that the capacity can hold the additional element.
 
-        Implementation detail: Normalization will put the _start element at index 0 of
-        the _ring_buffer. Growing the deque will double the capacity and copy elements
-        over, such that push time complexity is amortized to O(1).
+        Implementation detail: Growing the deque will double the capacity, and copy the
+        elements over (in one pass) to start at index 0 of the new _ring_buffer, such
+        that push time complexity is amortized to O(1).
 
         Args:
             value (T): The value to be added.
@@ -87,10 +86,11 @@ class Deque[T]:
             >>> print(deque)
             [3, 2, 1]
         """
-        if self._size >= self.capacity():
+        if self._size >= len(self._ring_buffer):
             self._grow()
-        self._start = self._index(-1)
-        self._ring_buffer[self._start] = value
+        buffer = self._ring_buffer
+        self._start = (self._start - 1) % len(buffer)
+        buffer[self._start] = value
         self._size += 1
 
     def push_back(self, value: T) -> None:
@@ -99,12 +99,12 @@ class Deque[T]:
         After inserting the element, the element will now be the last element in the
         deque, aka, the back.
 
-        If the deque is at capacity (len(deque) == deque.capacity()), we normalize and
-        grow the deque such that the capacity can hold the additional element.
+        If the deque is at capacity (len(deque) == deque.capacity()), we grow the deque
+        such that the capacity can hold the additional element.
 
-        Implementation detail: Normalization will put the _start element at index 0 of
-        the _ring_buffer. Growing the deque will double the capacity and copy elements
-        over, such that push time complexity is amortized to O(1).
+        Implementation detail: Growing the deque will double the capacity, and copy the
+        elements over (in one pass) to start at index 0 of the new _ring_buffer, such
+        that push time complexity is amortized to O(1).
 
         Args:
             value (T): The value to be added.
@@ -117,11 +117,46 @@ class Deque[T]:
             >>> print(deque)
             [1, 2, 3]
         """
-        if self._size >= self.capacity():
+        if self._size >= len(self._ring_buffer):
             self._grow()
-        self._ring_buffer[self._index(self._size)] = value
+        buffer = self._ring_buffer
+        buffer[(self._start + self._size) % len(buffer)] = value
         self._size += 1
 
+    def extend(self, iterable: Iterable[T]) -> None:
+        """Append all values from the given iterable at the end of the deque.
+
+        Equivalent to calling push_back for each value in order, so the last value of
+        the iterable will become the back of the deque. Rather than checking the
+        capacity for every value, we grow (at most) once to fit all of the values, and
+        then copy them into the ring buffer with (one or two) slice assignments.
+
+        Complexity:
+            Time: O(k), where k is the number of values added, plus O(n) if grown.
+            Space: O(k), since the values are collected into a list first.
+
+        Args:
+            iterable (Iterable[T]): The values to be added.
+
+        Examples:
+            >>> deque = Deque.from_iterable([1, 2])
+            >>> deque.extend([3, 4, 5])
+            >>> print(deque)
+            [1, 2, 3, 4, 5]
+        """
+        values = list(iterable)
+        if not values:
+            return
+        if self._size + len(values) > self.capacity():
+            self._grow(self._size + len(values))
+
+        buffer = self._ring_buffer
+        end = (self._start + self._size) % len(buffer)
+        first = min(len(values), len(buffer) - end)  # Values before wrapping.
+        buffer[end : end + first] = values[:first]
+        buffer[: len(values) - first] = values[first:]
+        self._size += len(values)
+
     def pop_front(self) -> Optional[T]:
         """Removes and returns the first element of the deque (the front).
 
@@ -137,11 +172,13 @@ class Deque[T]:
             2
             >>> deque.pop_front()
         """
-        if len(self) == 0:
+        if self._size == 0:
             return None
-        value = self._ring_buffer[self._start]
-        self._ring_buffer[self._start] = None  # We don't *need* to erase the element.
-        self._start = self._index(1)
+        buffer = self._ring_buffer
+        start = self._start
+        value = buffer[start]
+        buffer[start] = None  # We don't *need* to erase the element.
+        self._start = (start + 1) % len(buffer)
         self._size -= 1
         return value
 
@@ -164,11 +201,11 @@ class Deque[T]:
             1
             >>> deque.pop_back()
         """
-        if len(self) == 0:
+        if self._size == 0:
             return None
         self._size -= 1
-        value = self._ring_buffer[self._index(self._size)]
-        return value
+        buffer = self._ring_buffer
+        return buffer[(self._start + self._size) % len(buffer)]
 
     def front(self) -> Optional[T]:
         """Get the first element of the deque (the front, or leftmost element).
@@ -182,7 +219,7 @@ class Deque[T]:
             >>> deque.front()
             1
         """
-        if len(self) == 0:
+        if self._size == 0:
             return None
         return self._ring_buffer[self._start]
 
@@ -198,9 +235,10 @@ class Deque[T]:
             >>> deque.back()
             3
         """
-        if len(self) == 0:
+        if self._size == 0:
             return None
-        return self._ring_buffer[self._index(self._size - 1)]
+        buffer = self._ring_buffer
+        return buffer[(self._start + self._size - 1) % len(buffer)]
 
     def is_empty(self) -> bool:
         """Returns true if the deque is empty (has no elements).
@@ -218,77 +256,72 @@ class Deque[T]:
         """
         return self._size == 0
 
-    def _index(self, offset: int) -> int:
-        """Helper to convert a logical offset (nth element) into a ring buffer index.
+    def _grow(self, capacity: int = 0) -> None:
+        """Helper to grow (double) the capacity if needed.
 
-        To get this index, we need to modulo the offset by the capacity, to handle cases
-        where the offset wraps us beyond the end of the array.
+        The elements may wrap around the end of the ring buffer, so they cannot simply
+        be extended in place. Otherwise, the sequence may become disjoint, leading to
+        undefined behavior. Instead, we allocate the bigger ring buffer once, and copy
+        the (one or two) contiguous slices of elements to its beginning.
 
-        Args:
-            offset (int): The logical offset of the target element. The offset
-              corresponds to the "n-th" element (0-based). However, due to the rotating
-              nature of the ring buffer, we need to re-map this to a real index.
+        After growing, the _start will be at the beginning of the ring buffer.
 
-        Returns:
-            int: A re-mapped index that can be used to index the _ring_buffer. This
-              index should get the logical element at the given offset.
+        Args:
+            capacity (int, optional): The minimum capacity required after growing. Used
+              to fit many new elements at once (see extend). Defaults to 0 (double).
 
         Examples:
             >>> deque = Deque(capacity=4)
-            >>> deque.push_back(1)
-            >>> deque.push_back(2)
-            >>> deque.push_back(3)
+            >>> for value in [1, 2, 3, 4]:
+            ...     deque.push_back(value)
             >>> deque.pop_front()
             1
+            >>> deque.push_back(5)
             >>> deque._ring_buffer
-            [None, 2, 3, None]
-            >>> deque._index(0)
-            1
+            [5, 2, 3, 4]
+            >>> deque._grow()
+            >>> deque._ring_buffer
+            [2, 3, 4, 5, None, None, None, None]
         """
-        return (self._start + offset) % self.capacity()
+        buffer = self._ring_buffer
+        ring_buffer: list[Optional[T]] = [None] * max(capacity, 2 * len(buffer))
+        first = min(self._size, len(buffer) - self._start)  # Elements before wrapping.
+        ring_buffer[:first] = buffer[self._start : self._start + first]
+        ring_buffer[first : self._size] = buffer[: self._size - first]
+        self._ring_buffer = ring_buffer
+        self._start = 0
+
+    def _as_list(self) -> list[T]:
+        """Helper to copy the elements of the deque into a list (from front to back).
 
-    def _normalize(self) -> None:
-        """Helper to normalize the ring buffer (such that _start is index 0).
+        The valid elements of the ring buffer are at most two contiguous slices: from
+        _start towards the end of the ring buffer, and (if they wrap around) from the
+        beginning of the ring buffer. So, the copy is one or two slices (in C), rather
+        than re-mapping each index into the ring buffer.
 
-        We can perform normalization by simply rotating the _start index into place at
-        index 0. This is important if we need to resize the ring buffer, without making
-        it inconsistent.
+        Returns:
+            list[T]: The elements of the deque, in order.
 
         Examples:
             >>> deque = Deque(capacity=4)
-            >>> deque.push_back(1)
-            >>> deque.push_back(2)
-            >>> deque.push_back(3)
+            >>> for value in [1, 2, 3, 4]:
+            ...     deque.push_back(value)
             >>> deque.pop_front()
             1
+            >>> deque.push_back(5)
             >>> deque._ring_buffer
-            [None, 2, 3, None]
-            >>> deque._normalize()
-            >>> deque._ring_buffer
-            [2, 3, None, None]
-        """
-        rotate(self._ring_buffer, -self._start)
-        self._start = 0
-
-    def _grow(self) -> None:
-        """Helper to grow (double) the capacity if needed.
-
-        Before growing the capacity, we must normalize the ring buffer to prevent any
-        inconsitencies at the end of the ring buffer. Otherwise, the sequence may
-        become disjoint, leading to undefined behavior.
-
-        After normalization, the _start will be at the beginning of the ring buffer.
-
-        Examples:
-            >>> deque = Deque(capacity=2)
-            >>> deque.capacity()
-            2
-            >>> deque._grow()
-            >>> deque.capacity()
-            4
+            [5, 2, 3, 4]
+            >>> deque._as_list()
+            [2, 3, 4, 5]
         """
-        self._normalize()
-        self._ring_buffer = self._ring_buffer + [None] * self.capacity()
+        buffer = self._ring_buffer
+        end = self._start + self._size
+        if end <= len(buffer):
+            values = buffer[self._start : end]
+        else:
+            values = buffer[self._start :] + buffer[: end - len(buffer)]
+        # Due to the class invariant, there is no non-T data in the valid index range.
+        return cast("list[T]", values)
 
     def capacity(self) -> int:
         """The current total available capacity of the deque.
@@ -303,24 +336,42 @@ class Deque[T]:
         return len(self._ring_buffer)
 
     def __iter__(self) -> Iterator[T]:
-        """Returns a generator of values from the deque (in remove / FIFO order).
+        """Returns an iterator of values from the deque (in remove / FIFO order).
 
-        The deque remains unchanged from this method.
+        The deque remains unchanged from this method. The valid elements of the ring
+        buffer are at most two contiguous ranges (the second one if they wrap around the
+        end), so the values are read lazily from each range with islice, rather than
+        re-mapping each index into the ring buffer in a Python loop.
 
-        Yields:
+        Returns:
             Iterator[T]: Values from the deque.
+
+        Examples:
+            >>> deque = Deque(capacity=3)
+            >>> for value in [1, 2, 3]:
+            ...     deque.push_back(value)
+            >>> deque.pop_front()
+            1
+            >>> deque.push_back(4)
+            >>> list(deque)
+            [2, 3, 4]
         """
-        for i in range(self._size):
-            # It is *possible* to encounter None via type system, but due to class
-            # invariant, we should never encounter non-T data in the valid index range.
-            value = self._ring_buffer[self._index(i)]
-            if value is not None:
-                yield value
+        buffer = self._ring_buffer
+        end = self._start + self._size
+        values = chain(
+            islice(buffer, self._start, min(end, len(buffer))),
+            islice(buffer, max(0, end - len(buffer))),
+        )
+        # Due to the class invariant, there is no non-T data in the valid index ranges.
+        return cast("Iterator[T]", values)
 
     def __contains__(self, value: T) -> bool:
         """Whether a value is present in the deque.
 
-        Must iterate over the deque, so operates in O(n) time.
+        Must search the whole deque, so operates in O(n) time. The valid elements of the
+        ring buffer are at most two contiguous ranges (the second one if they wrap
+        around the end), so we search each range in place with list.index (in C),
+        rather than re-mapping each index into the ring buffer in a Python loop.
 
         Args:
             value (T): The value to search for in the deque.
@@ -335,7 +386,18 @@ class Deque[T]:
             >>> 5 in deque
             False
         """
-        return value in iter(self)
+        buffer = self._ring_buffer
+        end = self._start + self._size
+        for start, stop in (
+            (self._start, min(end, len(buffer))),
+            (0, max(0, end - len(buffer))),
+        ):
+            try:
+                buffer.index(value, start, stop)
+            except ValueError:
+                continue
+            return True
+        return False
 
     def __len__(self) -> int:
         """Returns the number of elements in the deque.
@@ -364,4 +426,4 @@ class Deque[T]:
             >>> str(deque)
             '[1, 2, 3]'
         """
-        return str(list(self))
+        return str(self._as_list())
@@ -44,13 +44,15 @@ def binary_search[CT: SupportsRichComparison](
 
     while low < high:
         mid = (low + high) // 2
-        if target == array[mid]:
-            return mid
-
-        if array[mid] < target:
+        # Index once, and test the (more likely) inequalities before equality. This
+        # only relies on the < operator, as required by SupportsRichComparison.
+        value = array[mid]
+        if value < target:
             low = mid + 1
-        else:
+        elif target < value:
             high = mid
+        else:
+            return mid
     return None
 
 
@@ -10,6 +10,10 @@ class Stack[T]:
       - peek, O(1)
     """
 
+    # The buffer is the only attribute, so it is declared in __slots__ (no per-stack
+    # __dict__). The size is len(self._buffer), rather than a separate counter.
+    __slots__ = ("_buffer",)
+
     _buffer: list[T]
 
     def __init__(self):
@@ -19,6 +23,10 @@ class Stack[T]:
     def from_iterable(cls, iterable: Iterable[T]) -> Self:
         """Create a new stack from an iterable of values.
 
+        Rather than pushing the values one at a time, the buffer is built with a single
+        list() call. It preallocates from the length (or length hint) of the iterable
+        and copies the values in C, instead of growing the buffer geometrically.
+
         Args:
             iterable (Iterable[T]): An iterable of values to add into the stack. The
               values will be pushed onto the stack in the order that they are given.
@@ -32,8 +40,7 @@ class Stack[T]:
             [1, 2, 3]
         """
         stack = cls()
-        for value in iterable:
-            stack.push(value)
+        stack._buffer = list(iterable)
         return stack
 
     def push(self, value: T) -> None:
@@ -67,7 +74,7 @@ class Stack[T]:
             1
             >>> stack.pop()
         """
-        if len(self) == 0:
+        if not self._buffer:
             return None
         return self._buffer.pop()
 
@@ -85,7 +92,7 @@ class Stack[T]:
             >>> stack = Stack()
             >>> stack.peek()
         """
-        if len(self) == 0:
+        if not self._buffer:
             return None
         return self._buffer[-1]
 
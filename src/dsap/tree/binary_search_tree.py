@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Iterable, Iterator, Optional
 
 from dsap.stack import Stack
 from dsap.type import SupportsRichComparison
 
 
-@dataclass
 class _Node[CT: SupportsRichComparison]:
+    # Nodes are allocated per value, so attributes are declared in __slots__ (no
+    # per-node __dict__). Nodes compare by identity (there is no generated __eq__).
+    __slots__ = ("data", "left", "right")
+
     data: CT
-    left: Optional[_Node[CT]] = None
-    right: Optional[_Node[CT]] = None
+    left: Optional[_Node[CT]]
+    right: Optional[_Node[CT]]
+
+    def __init__(self, data: CT):
+        self.data = data
+        self.left = None
+        self.right = None
 
 
 class BinarySearchTree[CT: SupportsRichComparison]:
@@ -209,7 +216,7 @@ class BinarySearchTree[CT: SupportsRichComparison]:
 
         if parent is None:
             self._root = new_node
-        elif parent.left == node:
+        elif parent.left is node:
             parent.left = new_node
         else:
             parent.right = new_node
@@ -299,7 +306,7 @@ class BinarySearchTree[CT: SupportsRichComparison]:
             >>> list(bst)
             [5, 8, 10, 11, 12]
         """
-        yield from self.inorder_recursive()
+        yield from self.inorder_iterative()
 
     def inorder_recursive(self) -> Iterator[CT]:
         """Recursive implementation of in-order traversal from the tree.
@@ -361,6 +368,63 @@ class BinarySearchTree[CT: SupportsRichComparison]:
                 yield current.data
                 current = current.right
 
+    def inorder_morris(self) -> Iterator[CT]:
+        """Morris (threaded) implementation of in-order traversal from the tree.
+
+        Instead of a stack, we temporarily link the in-order predecessor of each node
+        (the rightmost node of its left subtree) back to the node, via the unused right
+        pointer. After visiting the left subtree, the thread leads back up to the node,
+        and is removed. So, the traversal needs no extra space, but it does modify the
+        tree while iterating, and walks each left subtree's right spine twice.
+
+        If the iteration is stopped early (e.g., break), the remaining nodes are walked
+        (without yielding) to remove all threads. While iterating, the tree must not be
+        modified, nor traversed by any other iterator.
+
+        Complexity:
+            Time: O(n)
+            Space: O(1)
+
+        Yields:
+            Iterator[CT]: Values in-order from the tree.
+
+        Examples:
+            >>> bst = BinarySearchTree.from_iterable([5, 10, 8, 12, 11])
+            >>> list(bst.inorder_morris())
+            [5, 8, 10, 11, 12]
+        """
+        nodes = self._morris_nodes()
+        try:
+            for node in nodes:
+                yield node.data
+        finally:
+            for _ in nodes:
+                pass  # Finish the traversal to restore the tree.
+
+    def _morris_nodes(self) -> Iterator[_Node[CT]]:
+        """Helper generator for inorder_morris, yielding the nodes in-order.
+
+        Yields:
+            Iterator[_Node[CT]]: Nodes in-order from the tree.
+        """
+        current = self._root
+        while current is not None:
+            if current.left is None:
+                yield current
+                current = current.right
+                continue
+
+            predecessor = current.left
+            while predecessor.right is not None and predecessor.right is not current:
+                predecessor = predecessor.right
+            if predecessor.right is None:
+                predecessor.right = current  # Thread back up, then visit the left.
+                current = current.left
+            else:
+                predecessor.right = None  # The left subtree is done, remove the thread.
+                yield current
+                current = current.right
+
     def __contains__(self, value: CT) -> bool:
         """Return true if the value exists in the binary search tree.
 
@@ -1,11 +1,12 @@
 import pytest
 
-from dsap.graph import Graph, MatrixGraph, NodeGraph
+from dsap.graph import BitsetGraph, Graph, MatrixGraph, NodeGraph
 from dsap.graph.graph import GraphBase
 
 pytestmark = pytest.mark.parametrize(
     "cls",
     [
+        BitsetGraph,
         Graph,
         MatrixGraph,
         NodeGraph,
@@ -120,6 +121,25 @@ class TestGraph:
         assert not graph
         assert str(graph) == ""
 
+    def test_remove_then_re_add(self, cls: type[GraphBase[int]]) -> None:
+        graph = cls.from_edges([(1, 2), (2, 1), (2, 2), (3, 2)])
+
+        graph.remove(2)
+        graph.add_edge((1, 2))
+        graph.add_edge((2, 3))
+        assert (
+            str(graph)
+            == """\
+1 -> [2]
+2 -> [3]
+3 -> []"""
+        )
+
+        graph.remove(1)
+        graph.remove(3)
+        assert not graph.has_edge((2, 3))
+        assert str(graph) == "2 -> []"
+
     def test_add_edge(self, cls: type[GraphBase[int]]) -> None:
         graph = cls()
 
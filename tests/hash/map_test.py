@@ -1,12 +1,12 @@
 import pytest
 
-from dsap.hash import Map, MapLinkedList, MapList
+from dsap.hash import MapLinkedList, MapList, MapOpenAddressing
 from dsap.hash.map import MapBase
 from dsap.sort import sort
 
 pytestmark = pytest.mark.parametrize(
     "cls",
-    [Map, MapList, MapLinkedList],
+    [MapOpenAddressing, MapList, MapLinkedList],
 )
 
 
@@ -19,6 +19,18 @@ class TestMap:
         assert len(hm) == 0
         assert list(hm) == []
 
+    def test_empty_map_lookups(self, cls: type[MapBase[str, int]]) -> None:
+        hm = cls()
+
+        with pytest.raises(KeyError, match="key not found in map"):
+            hm["a"]
+        with pytest.raises(KeyError, match="key not found in map"):
+            del hm["a"]
+        assert list(hm.items()) == []
+
+        hm["a"] = 1
+        assert hm["a"] == 1
+
     def test_from_items(self, cls: type[MapBase[str, int]]) -> None:
         hm = cls.from_items([("a", 1), ("b", 2), ("c", 3), ("b", 4)])
 
@@ -105,3 +117,20 @@ class TestMap:
         assert len(hm) == 26
         assert list(sort(hm)) == list(alphabet)
         assert list(sort(hm.items())) == [(ch, i) for i, ch in enumerate(alphabet)]
+
+    def test_colliding_keys(self, cls: type[MapBase[int, int]]) -> None:
+        hm = cls(capacity=31)
+        keys = [0, 31, 1, 62, 32, 2, 93]  # Keys that collide (or cluster) mod 31.
+        for key in keys:
+            hm[key] = key * 10
+
+        del hm[31]
+        del hm[1]
+        assert 31 not in hm
+        assert 1 not in hm
+        for key in [0, 62, 32, 2, 93]:
+            assert hm[key] == key * 10
+
+        hm[31] = 0
+        assert hm[31] == 0
+        assert len(hm) == 6
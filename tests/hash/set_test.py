@@ -44,9 +44,9 @@ class TestSet:
         s.remove(4)
         assert len(s) == 2
 
-        with pytest.raises(KeyError, match="key not found in map"):
+        with pytest.raises(KeyError, match="value not found in set"):
             s.remove(4)
-        with pytest.raises(KeyError, match="key not found in map"):
+        with pytest.raises(KeyError, match="value not found in set"):
             s.remove(5)
 
     def test_iter(self) -> None:
@@ -69,3 +69,24 @@ class TestSet:
 
         assert len(s) == 4
         assert list(sort(s)) == [1, 2, 3, 4]
+
+    def test_colliding_values(self) -> None:
+        s = Set[int](capacity=31)
+        values = [0, 31, 1, 62, 32, 2, 93]  # Values that collide (or cluster) mod 31.
+        for value in values:
+            s.add(value)
+
+        s.remove(31)
+        s.remove(1)
+        assert 31 not in s
+        assert 1 not in s
+        assert all(value in s for value in [0, 62, 32, 2, 93])
+        assert len(s) == 5
+
+    def test_grow(self) -> None:
+        s = Set[int](capacity=1)
+        for value in range(100):
+            s.add(value)
+
+        assert len(s) == 100
+        assert list(sort(s)) == list(range(100))
@@ -73,6 +73,29 @@ class TestMinHeap:
         assert 6 not in heap
         assert 10 not in heap
 
+    def test_pushpop(self) -> None:
+        heap = MinHeap[int].from_iterable([5, 1, 3])
+
+        assert heap.pushpop(0) == 0  # Higher priority than the root.
+        assert heap.pushpop(4) == 1
+        assert heap.pushpop(3) == 3
+        assert len(heap) == 3
+        assert list(heap.consume_all()) == [3, 4, 5]
+
+        assert heap.pushpop(2) == 2  # Empty heap.
+        assert heap.is_empty()
+
+    def test_replace(self) -> None:
+        heap = MinHeap[int].from_iterable([5, 1, 3])
+
+        assert heap.replace(0) == 1  # Always pops from the heap first.
+        assert heap.replace(4) == 0
+        assert len(heap) == 3
+        assert list(heap.consume_all()) == [3, 4, 5]
+
+        assert heap.replace(2) is None  # Empty heap.
+        assert list(heap.consume_all()) == [2]
+
     def test_remove_on_empty(self) -> None:
         heap = MinHeap[int]()
 
@@ -126,3 +149,26 @@ class TestMaxHeap:
         for value in range(100):
             heap2.push(value)
         assert list(heap2.consume_all()) == list(reversed(range(100)))
+
+    def test_pushpop(self) -> None:
+        heap = MaxHeap[int].from_iterable([1, 5, 3])
+
+        assert heap.pushpop(6) == 6  # Higher priority than the root.
+        assert heap.pushpop(2) == 5
+        assert heap.pushpop(3) == 3
+        assert len(heap) == 3
+        assert list(heap.consume_all()) == [3, 2, 1]
+
+        assert heap.pushpop(2) == 2  # Empty heap.
+        assert heap.is_empty()
+
+    def test_replace(self) -> None:
+        heap = MaxHeap[int].from_iterable([1, 5, 3])
+
+        assert heap.replace(6) == 5  # Always pops from the heap first.
+        assert heap.replace(2) == 6
+        assert len(heap) == 3
+        assert list(heap.consume_all()) == [3, 2, 1]
+
+        assert heap.replace(2) is None  # Empty heap.
+        assert list(heap.consume_all()) == [2]
@@ -51,3 +51,13 @@ class TestPairwiseTransform:
 
         assert list(pairwise_transform([1, 3, -1, 1], average)) == [2, 1, 0]
         assert list(pairwise_transform([1, 2, 5], average)) == [1.5, 3.5]
+
+    def test_generator_input(self):
+        assert list(pairwise_transform(x for x in [1, 2, 3])) == [3, 5]
+        assert list(pairwise_transform(iter([]))) == []
+        assert list(pairwise_transform(iter(range(3)), operator.sub)) == [-1, -1]
+
+    def test_sequence_input(self):
+        assert list(pairwise_transform((1, 2, 3))) == [3, 5]
+        assert list(pairwise_transform(range(4))) == [1, 3, 5]
+        assert list(pairwise_transform("abc")) == ["ab", "bc"]
@@ -1,6 +1,6 @@
 import operator
 
-from dsap.iterable import reduce
+from dsap.iterable import reduce, scan
 
 
 class TestReduce:
@@ -9,6 +9,24 @@ class TestReduce:
         assert reduce([-1, 5]) == 4
         assert reduce([0, 0, 0, 0]) == 0
 
+    def test_operation_mul(self):
+        assert reduce([1, 2, 3, 4, 5], operator.mul) == 120
+        assert reduce([2, 0, 3], operator.mul) == 0
+        assert reduce([2, 3], operator.mul, initial=10) == 60
+        assert reduce(["ab"], operator.mul, initial=2) == "abab"
+
+    def test_non_numeric_add(self):
+        assert reduce(["a", "b", "c"]) == "abc"
+        assert reduce([b"a", b"b"]) == b"ab"
+        assert reduce([[1], [2, 3]]) == [1, 2, 3]
+        assert reduce([(1,), (2,)], initial=(0,)) == (0, 1, 2)
+
+    def test_float_fold_matches_scan(self):
+        values = [0.1] * 10
+        assert reduce(values) == list(scan(values))[-1] == 0.9999999999999999
+        assert reduce(values, initial=0.5) == list(scan(values, initial=0.5))[-1]
+        assert reduce(values, operator.mul) == list(scan(values, operator.mul))[-1]
+
     def test_operation_sub(self):
         assert reduce([1, 2, 3, 4, 5], operator.sub) == -13
         assert reduce([5, 1, 1, 1, 1], operator.sub) == 1
@@ -24,6 +42,19 @@ class TestReduce:
         assert reduce([], operator.mul) is None
         assert reduce([], initial=100) == 100
 
+    def test_absorbing_element(self):
+        assert reduce([2, 0, 3], operator.mul, absorbing=0) == 0
+        assert reduce([2, 3, 4], operator.mul, absorbing=0) == 24
+        assert reduce([1, 2], operator.mul, initial=0, absorbing=0) == 0
+        assert reduce([True, False, True], operator.and_, absorbing=False) is False
+        assert reduce([], operator.mul, absorbing=0) is None
+
+    def test_absorbing_element_stops_early(self):
+        values = iter([3, 5, 0, 2, 7])
+
+        assert reduce(values, min, absorbing=0) == 0
+        assert list(values) == [2, 7]
+
     def test_count_ones(self):
         def count_if_even(total: int, item: int) -> int:
             if item % 2 == 0:
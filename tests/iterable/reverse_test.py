@@ -1,3 +1,5 @@
+import collections
+
 from dsap.iterable import reverse
 
 
@@ -31,3 +33,12 @@ class TestReverse:
         assert reverse([1, 2, 3, 4, 5], start=1, end=4) == [1, 4, 3, 2, 5]
         assert reverse([1, 2, 3, 4, 5], start=1, end=10) == [1, 5, 4, 3, 2]
         assert reverse([1, 2, 3, 4, 5], start=3, end=4) == [1, 2, 3, 4, 5]
+
+    def test_generic_mutable_sequence(self):
+        array = bytearray(b"abcde")
+        assert reverse(array, start=1, end=4) == bytearray(b"adcbe")
+
+        # Exercise the swapping fallback with a non-list mutable sequence.
+        deque = collections.deque([1, 2, 3, 4, 5])
+        assert reverse(deque) == collections.deque([5, 4, 3, 2, 1])
+        assert reverse(deque, start=1, end=3) == collections.deque([5, 3, 4, 2, 1])
@@ -1,6 +1,8 @@
 import operator
 
-from dsap.iterable import scan
+import pytest
+
+from dsap.iterable import exclusive_scan, scan
 
 
 class TestScan:
@@ -44,3 +46,30 @@ class TestScan:
             2,
             3,
         ]
+
+
+class TestExclusiveScan:
+    def test_default_operation_add(self):
+        assert list(exclusive_scan([1, 2, 3, 4, 5])) == [0, 1, 3, 6, 10]
+        assert list(exclusive_scan([-1, 5])) == [0, -1]
+        assert list(exclusive_scan([7])) == [0]
+
+    def test_initial_value(self):
+        assert list(exclusive_scan([1, 2, 3], initial=10)) == [10, 11, 13]
+        assert list(exclusive_scan([2, 3, 4], operator.mul, initial=1)) == [1, 2, 6]
+        assert list(exclusive_scan(["b", "c"], initial="a")) == ["a", "ab"]
+
+    def test_float_default_initial(self):
+        assert list(exclusive_scan([0.5, 1.5, 2.0])) == [0, 0.5, 2.0]
+
+    def test_none_initial(self):
+        with pytest.raises(ValueError):
+            exclusive_scan([1, 2, 3], initial=None)
+
+    def test_empty_input_iterator(self):
+        assert list(exclusive_scan([])) == []
+        assert list(exclusive_scan([], initial=100)) == []
+
+    def test_matches_shifted_inclusive_scan(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+        assert list(exclusive_scan(iter(values))) == list(scan(values, initial=0))[:-1]
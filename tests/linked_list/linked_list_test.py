@@ -48,6 +48,39 @@ class TestLinkedList:
         assert len(linked_list) == 3
         assert str(linked_list) == "1->2->3->None"
 
+    def test_extend_head(self, cls: type[LinkedListBase[int]]) -> None:
+        linked_list = cls()
+
+        linked_list.extend_head([3, 4])
+        assert len(linked_list) == 2
+        assert str(linked_list) == "3->4->None"
+
+        linked_list.extend_head(iter([1, 2]))
+        linked_list.extend_head([])
+        assert len(linked_list) == 4
+        assert str(linked_list) == "1->2->3->4->None"
+
+        linked_list.push_head(0)
+        linked_list.remove_tail()
+        assert str(linked_list) == "0->1->2->3->None"
+
+    def test_extend_tail(self, cls: type[LinkedListBase[int]]) -> None:
+        linked_list = cls()
+
+        linked_list.extend_tail([1, 2])
+        assert len(linked_list) == 2
+        assert str(linked_list) == "1->2->None"
+
+        linked_list.extend_tail(iter([3, 4]))
+        linked_list.extend_tail([])
+        assert len(linked_list) == 4
+        assert str(linked_list) == "1->2->3->4->None"
+
+        linked_list.push_tail(5)
+        linked_list.remove_tail()
+        linked_list.remove_tail()
+        assert str(linked_list) == "1->2->3->None"
+
     def test_remove_head(self, cls: type[LinkedListBase[int]]) -> None:
         linked_list = cls.from_iterable([1, 2, 3])
 
@@ -79,6 +112,26 @@ class TestLinkedList:
         assert len(linked_list) == 0
         assert str(linked_list) == "None"
 
+    def test_interleaved_tail_operations(self, cls: type[LinkedListBase[int]]) -> None:
+        linked_list = cls.from_iterable([1, 2, 3])
+
+        linked_list.push_tail(4)
+        linked_list.remove_tail()
+        linked_list.remove_tail()
+        assert str(linked_list) == "1->2->None"
+
+        linked_list.push_head(0)
+        linked_list.remove(1)
+        linked_list.remove_tail()
+        assert str(linked_list) == "0->None"
+
+        linked_list.extend_tail([5, 6])
+        linked_list.remove_tail()
+        linked_list.remove_tail()
+        linked_list.remove_tail()
+        assert len(linked_list) == 0
+        assert str(linked_list) == "None"
+
     def test_remove(self, cls: type[LinkedListBase[int]]) -> None:
         linked_list = cls.from_iterable([1, 2, 1, 3, 1])
 
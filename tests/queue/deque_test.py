@@ -14,6 +14,35 @@ class TestDeque:
         assert len(deque) == 3
         assert str(deque) == "[1, 2, 3]"
 
+    def test_extend(self) -> None:
+        deque = Deque[int](capacity=4)
+        deque.extend([])
+        assert len(deque) == 0
+        assert deque.capacity() == 4
+
+        deque.extend([1, 2])
+        assert str(deque) == "[1, 2]"
+        assert deque.capacity() == 4
+
+        # Fill past the end of the ring buffer, wrapping around to the beginning.
+        deque.pop_front()
+        deque.pop_front()
+        deque.extend(iter([3, 4, 5]))
+        assert str(deque) == "[3, 4, 5]"
+        assert deque.capacity() == 4
+
+        # Grows once to fit all values, when doubling would not be enough.
+        deque.extend(range(6, 16))
+        assert len(deque) == 13
+        assert deque.capacity() == 13
+        assert list(deque) == list(range(3, 16))
+        assert deque.front() == 3
+        assert deque.back() == 15
+
+        deque.extend([16])
+        assert deque.capacity() == 26
+        assert list(deque) == list(range(3, 17))
+
     def test_push_front(self) -> None:
         deque = Deque[int]()
 
@@ -98,6 +127,17 @@ class TestDeque:
         empty_deque = Deque[int]()
         assert list(empty_deque) == []
 
+        wrapped_deque = Deque[int](capacity=2)
+        wrapped_deque.push_back(1)
+        wrapped_deque.push_back(2)
+        wrapped_deque.pop_front()
+        wrapped_deque.push_back(3)
+        assert list(wrapped_deque) == [2, 3]
+        assert str(wrapped_deque) == "[2, 3]"
+
+        optional_deque = Deque[int | None].from_iterable([None, 1])
+        assert list(optional_deque) == [None, 1]
+
     def test_contains(self) -> None:
         deque = Deque[int].from_iterable([1, 2, 3])
         assert 1 in deque
@@ -110,6 +150,24 @@ class TestDeque:
         assert 1 not in empty_deque
         assert None not in empty_deque
 
+    def test_contains_wrapped(self) -> None:
+        deque = Deque[int](capacity=4)
+        for value in [1, 2, 3, 4]:
+            deque.push_back(value)
+        deque.pop_front()
+        deque.pop_front()
+        deque.push_back(5)  # Wraps around the end of the ring buffer.
+        assert list(deque) == [3, 4, 5]
+
+        assert 3 in deque
+        assert 4 in deque
+        assert 5 in deque
+        assert 1 not in deque
+        assert 2 not in deque
+
+        assert deque.pop_back() == 5
+        assert 5 not in deque  # Popped, though still in the ring buffer.
+
     def test_capacity_doubles(self) -> None:
         deque = Deque[int](capacity=1)
         assert deque.capacity() == 1
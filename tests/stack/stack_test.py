@@ -14,6 +14,13 @@ class TestStack:
         assert str(stack) == "[1, 2, 3]"
         assert stack
 
+        # Generators have no length, and the stack does not share the input list.
+        assert str(Stack[int].from_iterable(i for i in range(3))) == "[0, 1, 2]"
+        values = [1, 2]
+        stack = Stack[int].from_iterable(values)
+        values.append(3)
+        assert len(stack) == 2
+
     def test_push(self) -> None:
         stack = Stack[int]()
 
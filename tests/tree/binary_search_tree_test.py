@@ -11,6 +11,7 @@ class TestBinarySearchTree:
         assert list(bst) == []
         assert list(bst.inorder_iterative()) == []
         assert list(bst.inorder_recursive()) == []
+        assert list(bst.inorder_morris()) == []
 
     def test_empty_tree(self) -> None:
         bst = BinarySearchTree[int]()
@@ -116,21 +117,39 @@ class TestBinarySearchTree:
         assert list(balanced_bst) == [1, 2, 3, 5, 7, 8, 9]
         assert list(balanced_bst.inorder_iterative()) == [1, 2, 3, 5, 7, 8, 9]
         assert list(balanced_bst.inorder_recursive()) == [1, 2, 3, 5, 7, 8, 9]
+        assert list(balanced_bst.inorder_morris()) == [1, 2, 3, 5, 7, 8, 9]
 
         ascending_bst = BinarySearchTree[int].from_iterable([1, 2, 3, 4, 5])
         assert list(ascending_bst) == [1, 2, 3, 4, 5]
         assert list(ascending_bst.inorder_iterative()) == [1, 2, 3, 4, 5]
         assert list(ascending_bst.inorder_recursive()) == [1, 2, 3, 4, 5]
+        assert list(ascending_bst.inorder_morris()) == [1, 2, 3, 4, 5]
 
         descending_bst = BinarySearchTree[int].from_iterable([5, 4, 3, 2, 1])
         assert list(descending_bst) == [1, 2, 3, 4, 5]
         assert list(descending_bst.inorder_iterative()) == [1, 2, 3, 4, 5]
         assert list(descending_bst.inorder_recursive()) == [1, 2, 3, 4, 5]
+        assert list(descending_bst.inorder_morris()) == [1, 2, 3, 4, 5]
 
         zigzag_bst = BinarySearchTree[int].from_iterable([2, 2, 1, 2, 1, 1, 2, 1, 2, 2])
         assert list(zigzag_bst) == [1, 1, 1, 1, 2, 2, 2, 2, 2, 2]
         assert list(zigzag_bst.inorder_iterative()) == [1, 1, 1, 1, 2, 2, 2, 2, 2, 2]
         assert list(zigzag_bst.inorder_recursive()) == [1, 1, 1, 1, 2, 2, 2, 2, 2, 2]
+        assert list(zigzag_bst.inorder_morris()) == [1, 1, 1, 1, 2, 2, 2, 2, 2, 2]
+
+    def test_inorder_morris_stopped_early(self) -> None:
+        bst = BinarySearchTree[int].from_iterable([5, 2, 1, 3, 8, 7, 9])
+        before = str(bst)
+
+        for value in bst.inorder_morris():
+            if value == 3:
+                break  # Threads are still in the tree, and must be removed.
+        assert str(bst) == before
+        assert list(bst.inorder_morris()) == [1, 2, 3, 5, 7, 8, 9]
+
+        assert any(value == 2 for value in bst.inorder_morris())
+        assert str(bst) == before
+        assert 9 in bst
 
     def test_contains(self) -> None:
         bst = BinarySearchTree[int].from_iterable([5, 10, 8, 12, 11])